@@ -3,6 +3,9 @@ from dataclasses import dataclass
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class YamlConfigModel:
@@ -43,7 +46,7 @@ class YamlConfigLoader:
             raise FileNotFoundError(f"YAML config file not found: {full_path}")
 
         with open(full_path, "r") as file:
-            self._data = yaml.safe_load(file)
+            self._data = yaml.load(file, Loader=_Loader)
 
     def getGroup(self, group: str):
         """Return the whole group dictionary/list."""
@@ -98,7 +101,7 @@ class YamlInitializer:
             raise FileNotFoundError(f"YAML config file not found: {full_path}")
 
         with open(full_path, "r") as file:
-            self._data = yaml.safe_load(file)
+            self._data = yaml.load(file, Loader=_Loader)
 
     def get_group(self, group: str):
         """Return the whole group dictionary/list."""
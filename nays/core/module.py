@@ -1,6 +1,6 @@
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Any, List, Optional, Type, Union
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
 
 from injector import Injector, inject
 
@@ -31,12 +31,13 @@ class ModuleMetadata:
     """
     Module metadata similar to NestJS @Module decorator.
     Contains providers, imports, exports, and routes.
+    Any sequence is accepted; getMetadata() returns the module's tuples.
     """
 
-    providers: List[Union[Provider, Type[Any]]] = field(default_factory=list)
-    imports: List[Type] = field(default_factory=list)
-    exports: List[Union[Provider, Type[Any]]] = field(default_factory=list)
-    routes: List["Route"] = field(default_factory=list)
+    providers: Sequence[Union[Provider, Type[Any]]] = ()
+    imports: Sequence[Type] = ()
+    exports: Sequence[Union[Provider, Type[Any]]] = ()
+    routes: Sequence["Route"] = ()
 
 
 class NaysModuleBase(ABC):
@@ -44,12 +45,14 @@ class NaysModuleBase(ABC):
     Base Module class similar to NestJS modules.
     Holds providers, imports, exports, and routes.
     Routes are defined at module level and managed by the module.
+    Metadata is stored as tuples since it is not mutated after decoration;
+    use register() to replace it.
     """
 
-    providers: List[Union[Provider, Type[Any]]] = []
-    imports: List[Type] = []
-    exports: List[Union[Provider, Type[Any]]] = []
-    routes: List[Route] = []
+    providers: Tuple[Union[Provider, Type[Any]], ...] = ()
+    imports: Tuple[Type, ...] = ()
+    exports: Tuple[Union[Provider, Type[Any]], ...] = ()
+    routes: Tuple[Route, ...] = ()
 
     @classmethod
     def getMetadata(cls) -> ModuleMetadata:
@@ -61,10 +64,10 @@ class NaysModuleBase(ABC):
     @classmethod
     def register(cls, metadata: ModuleMetadata) -> "NaysModuleBase":
         """Register module with custom metadata"""
-        cls.providers = metadata.providers
-        cls.imports = metadata.imports
-        cls.exports = metadata.exports
-        cls.routes = metadata.routes
+        cls.providers = tuple(metadata.providers)
+        cls.imports = tuple(metadata.imports)
+        cls.exports = tuple(metadata.exports)
+        cls.routes = tuple(metadata.routes)
         return cls
 
 
@@ -95,10 +98,10 @@ def NaysModule(
             cls = type(cls.__name__, (NaysModuleBase,) + cls.__bases__, dict(cls.__dict__))
 
         # Set module metadata on the class
-        cls.providers = providers or []
-        cls.imports = imports or []
-        cls.exports = exports or []
-        cls.routes = routes or []
+        cls.providers = tuple(providers or ())
+        cls.imports = tuple(imports or ())
+        cls.exports = tuple(exports or ())
+        cls.routes = tuple(routes or ())
 
         return cls
 
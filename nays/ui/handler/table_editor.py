@@ -59,6 +59,9 @@ class TableEditorWidget(QWidget):
     dataSaved = Signal(dict)  # Emitted when data is saved
     operationCancelled = Signal()  # Emitted when operation is cancelled
 
+    # Rows sampled per column by resizeColumnsToContents() (Qt defaults to 1000)
+    RESIZE_CONTENTS_PRECISION = 200
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Table Editor")
@@ -187,6 +190,10 @@ class TableEditorWidget(QWidget):
         self.tableView = QTableView()
         self.tableView.setAlternatingRowColors(False)
         self.tableView.setShowGrid(True)
+        # resizeColumnsToContents() samples a bounded number of rows on large loads
+        self.tableView.horizontalHeader().setResizeContentsPrecision(
+            self.RESIZE_CONTENTS_PRECISION
+        )
         layout.addWidget(self.tableView)
 
         # ===== STATUS BAR =====
@@ -205,6 +212,11 @@ class TableEditorWidget(QWidget):
         # Handler
         self.handler = None
 
+        # getDataAsNumpy()/getDataAsStructuredNumpy() results as
+        # (model, model.dataRevision, array)
+        self._numpyCache: Optional[Tuple[Any, int, np.ndarray]] = None
+        self._structuredCache: Optional[Tuple[Any, int, np.ndarray]] = None
+
         # Connect keyboard shortcuts
         self.setFocusPolicy(Qt.StrongFocus)
 
@@ -547,21 +559,48 @@ class TableEditorWidget(QWidget):
         return self.handler.getData() if self.handler else []
 
     def getDataAsNumpy(self) -> np.ndarray:
-        """Get table data as numpy array."""
-        return self.handler.getAllAsNumpy() if self.handler else np.array([])
+        """Get table data as numpy array.
+
+        The array is built once per table revision; each call returns a fresh copy.
+        """
+        if not self.handler:
+            return np.array([])
+
+        model = self.handler.model
+        cached = self._numpyCache
+        if cached is None or cached[0] is not model or cached[1] != model.dataRevision:
+            cached = (model, model.dataRevision, self.handler.getAllAsNumpy())
+            self._numpyCache = cached
+        return cached[2].copy()
+
+    def getDataAsStructuredNumpy(self) -> np.ndarray:
+        """Get table data as a 1D structured numpy array with one field per column.
+
+        Checkbox columns become bool fields, all-int and all-number columns become
+        int64 and float64 fields, and everything else becomes a fixed-width string
+        field. Like getDataAsNumpy(), the array is built once per table revision and
+        each call returns a fresh copy.
+        """
+        if not self.handler:
+            return np.array([])
+
+        model = self.handler.model
+        cached = self._structuredCache
+        if cached is None or cached[0] is not model or cached[1] != model.dataRevision:
+            keys = model.columnKeys
+            rows = model.rows
+            dtype = _structuredDtype(keys, model.cellTypes, rows)
+            array = np.array([tuple(row.get(key) for key in keys) for row in rows], dtype=dtype)
+            cached = (model, model.dataRevision, array)
+            self._structuredCache = cached
+        return cached[2].copy()
 
     def setData(self, data: Union[List[Dict[str, Any]], np.ndarray]):
         """Set table data."""
         if self.handler:
             if isinstance(data, np.ndarray):
                 # Numpy array - convert to list of dicts
-                rows = []
-                for row_vals in data:
-                    row_dict = {
-                        header: val for header, val in zip(self.handler.model.headers, row_vals)
-                    }
-                    rows.append(row_dict)
-                self.handler.loadData(rows)
+                self.handler.loadData(_rowsFromArray(self.handler.model.headers, data))
             elif isinstance(data, list) and data and isinstance(data[0], dict):
                 # List of dicts
                 self.handler.loadData(data)
@@ -571,6 +610,57 @@ class TableEditorWidget(QWidget):
             self.redoStack.clear()
 
 
+def _validateHeaders(headers: List[str]):
+    """Raise ValueError unless headers is a non-empty list."""
+    if not headers or not isinstance(headers, list):
+        raise ValueError("headers must be a non-empty list of strings")
+
+
+def _validateData(data: Optional[Union[List[Dict[str, Any]], np.ndarray]], headers: List[str]):
+    """Raise ValueError unless data is None, a 2D array matching headers, or a list of dicts."""
+    if data is None:
+        return
+    if isinstance(data, np.ndarray):
+        if data.ndim != 2 or data.shape[1] != len(headers):
+            raise ValueError("numpy data must be a 2D array with one column per header")
+    elif not (isinstance(data, list) and data and isinstance(data[0], dict)):
+        raise ValueError("data must be either a numpy 2D array or a list of dictionaries")
+
+
+def _rowsFromArray(headers: List[str], data: np.ndarray) -> List[Dict[str, Any]]:
+    """Convert a 2D array to row dicts.
+
+    tolist() unboxes every element to a Python scalar in one C pass, so the rows hold
+    plain str/int/float values instead of per-element numpy scalars.
+    """
+    return [dict(zip(headers, row_vals)) for row_vals in data.tolist()]
+
+
+def _structuredDtype(
+    keys: List[str], cellTypes: Dict[int, str], rows: List[Dict[str, Any]]
+) -> np.dtype:
+    """Build a structured dtype with one field per column key.
+
+    Checkbox columns map to bool. Other columns map to int64 or float64 when every
+    value is a (non-bool) int or number, and to a string wide enough for the longest
+    value otherwise.
+    """
+    fields = []
+    for col, key in enumerate(keys):
+        values = [row.get(key) for row in rows]
+        types = {type(value) for value in values}
+        if cellTypes.get(col) == "checkbox":
+            fields.append((key, "?"))
+        elif types and types <= {int}:
+            fields.append((key, "i8"))
+        elif types and types <= {int, float}:
+            fields.append((key, "f8"))
+        else:
+            width = max((len(str(value)) for value in values), default=0)
+            fields.append((key, f"U{max(width, 1)}"))
+    return np.dtype(fields)
+
+
 def createTableEditor(
     headers: List[str],
     data: Optional[Union[List[Dict[str, Any]], np.ndarray]] = None,
@@ -710,9 +800,9 @@ def createTableEditor(
         >>> edited_array = table.getDataAsNumpy()
     """
 
-    # Validate headers
-    if not headers or not isinstance(headers, list):
-        raise ValueError("headers must be a non-empty list of strings")
+    # Validate everything before any Qt object is created
+    _validateHeaders(headers)
+    _validateData(data, headers)
 
     # Create widget
     editor = TableEditorWidget(parent)
@@ -749,16 +839,10 @@ def createTableEditor(
     if data is not None:
         if isinstance(data, np.ndarray):
             # Numpy array - convert to list of dicts
-            rows = []
-            for row_vals in data:
-                row_dict = {header: val for header, val in zip(headers, row_vals)}
-                rows.append(row_dict)
-            handler.loadData(rows)
-        elif isinstance(data, list) and data and isinstance(data[0], dict):
+            handler.loadData(_rowsFromArray(headers, data))
+        else:
             # List of dicts
             handler.loadData(data)
-        else:
-            raise ValueError("data must be either a numpy 2D array or a list of dictionaries")
 
     # Update status and info
     editor._updateStatus("Ready")
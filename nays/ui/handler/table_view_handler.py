@@ -1,9 +1,32 @@
+from itertools import chain
+from sys import intern
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QObject, Qt, Signal
 from PySide6.QtWidgets import QApplication, QComboBox, QLineEdit, QStyledItemDelegate, QTableView
 
+# PySide6 resolves Qt enum attributes on every access, which is far slower than a
+# global lookup. data()/setData()/flags() run per visible cell, so resolve them once.
+_DISPLAY_ROLE = Qt.DisplayRole
+_EDIT_ROLE = Qt.EditRole
+_CHECK_STATE_ROLE = Qt.CheckStateRole
+_CELL_TYPE_ROLE = Qt.UserRole
+_COMBO_ITEMS_ROLE = Qt.UserRole + 1
+# Roles whose data() results are cached; the rest are cheap or unused and stay uncached
+_CACHED_ROLES = frozenset((_DISPLAY_ROLE, _EDIT_ROLE, _CHECK_STATE_ROLE))
+_CHECKED = Qt.Checked
+_UNCHECKED = Qt.Unchecked
+_HORIZONTAL = Qt.Horizontal
+_BASE_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+_CHECKABLE_FLAGS = _BASE_FLAGS | Qt.ItemIsUserCheckable
+
+
+def _internStr(value: Any) -> Any:
+    """Intern value if it is a string; config loaders may also pass numbers or None."""
+    return intern(value) if type(value) is str else value
+
+
 # ---------------------------------
 # Cell Delegates
 # ---------------------------------
@@ -15,6 +38,10 @@ class ComboBoxDelegate(QStyledItemDelegate):
     def __init__(self, items: List[str] = None, parent=None):
         super().__init__(parent)
         self.items = items or []
+        # item -> first position, so selecting the current value is a dict lookup
+        self.itemIndex: Dict[str, int] = {}
+        for position, item in enumerate(self.items):
+            self.itemIndex.setdefault(item, position)
 
     def createEditor(self, parent, option, index):
         combo = QComboBox(parent)
@@ -22,12 +49,14 @@ class ComboBoxDelegate(QStyledItemDelegate):
         return combo
 
     def setEditorData(self, editor: QComboBox, index: QModelIndex):
-        value = index.data(Qt.EditRole)
+        value = index.data(_EDIT_ROLE)
         if value is not None:
-            editor.setCurrentText(str(value))
+            position = self.itemIndex.get(str(value))
+            if position is not None:
+                editor.setCurrentIndex(position)
 
     def setModelData(self, editor: QComboBox, model, index: QModelIndex):
-        model.setData(index, editor.currentText(), Qt.EditRole)
+        model.setData(index, editor.currentText(), _EDIT_ROLE)
 
 
 class CheckBoxDelegate(QStyledItemDelegate):
@@ -53,11 +82,11 @@ class MultiTypeCellDelegate(QStyledItemDelegate):
         super().__init__(parent)
 
     def createEditor(self, parent, option, index):
-        cellType = index.data(Qt.UserRole)
+        cellType = index.data(_CELL_TYPE_ROLE)
 
         if cellType == "combobox":
             combo = QComboBox(parent)
-            items = index.data(Qt.UserRole + 1) or []
+            items = index.data(_COMBO_ITEMS_ROLE) or []
             combo.addItems(items)
             return combo
         elif cellType == "checkbox":
@@ -68,20 +97,20 @@ class MultiTypeCellDelegate(QStyledItemDelegate):
 
     def editorEvent(self, event, model, option, index):
         """Handle checkbox toggle on mouse click."""
-        cellType = index.data(Qt.UserRole)
+        cellType = index.data(_CELL_TYPE_ROLE)
 
         if cellType == "checkbox":
             # Handle mouse button release to toggle checkbox
             if event.type() == QEvent.MouseButtonRelease:
-                currentState = index.data(Qt.CheckStateRole)
-                newState = Qt.Unchecked if currentState == Qt.Checked else Qt.Checked
-                return model.setData(index, newState, Qt.CheckStateRole)
+                currentState = index.data(_CHECK_STATE_ROLE)
+                newState = _UNCHECKED if currentState == _CHECKED else _CHECKED
+                return model.setData(index, newState, _CHECK_STATE_ROLE)
 
         return super().editorEvent(event, model, option, index)
 
     def setEditorData(self, editor, index: QModelIndex):
-        cellType = index.data(Qt.UserRole)
-        value = index.data(Qt.EditRole)
+        cellType = index.data(_CELL_TYPE_ROLE)
+        value = index.data(_EDIT_ROLE)
 
         if cellType == "combobox" and isinstance(editor, QComboBox):
             if value is not None:
@@ -90,12 +119,12 @@ class MultiTypeCellDelegate(QStyledItemDelegate):
             editor.setText(str(value) if value is not None else "")
 
     def setModelData(self, editor, model, index: QModelIndex):
-        cellType = index.data(Qt.UserRole)
+        cellType = index.data(_CELL_TYPE_ROLE)
 
         if cellType == "combobox" and isinstance(editor, QComboBox):
-            model.setData(index, editor.currentText(), Qt.EditRole)
+            model.setData(index, editor.currentText(), _EDIT_ROLE)
         elif isinstance(editor, QLineEdit):
-            model.setData(index, editor.text(), Qt.EditRole)
+            model.setData(index, editor.text(), _EDIT_ROLE)
 
 
 # ---------------------------------
@@ -143,6 +172,23 @@ class TableViewModel(QAbstractTableModel):
         # Checkbox labels: (row, col) -> (checked_label, unchecked_label)
         self.cellCheckboxLabels: Dict[Tuple[int, int], Tuple[str, str]] = {}
 
+        # data() results for _CACHED_ROLES: (row, col, role) -> value. Views ask for these
+        # on every repaint, so results are kept until the model changes.
+        self._displayCache: Dict[Tuple[int, int, int], Any] = {}
+        # Bumped with every cache clear, so callers can tell when derived data is stale
+        self.dataRevision = 0
+        for signal in (
+            self.dataChanged,
+            self.layoutChanged,
+            self.modelReset,
+            self.rowsInserted,
+            self.rowsRemoved,
+            self.columnsInserted,
+            self.columnsRemoved,
+            self.headerDataChanged,
+        ):
+            signal.connect(self.clearDisplayCache)
+
     # ===== Basics =====
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self.rows)
@@ -169,7 +215,7 @@ class TableViewModel(QAbstractTableModel):
         checkboxLabels: Tuple[str, str] = None,
     ):
         """Set cell type for a specific cell."""
-        self.cellTypeOverrides[(row, col)] = cellType
+        self.cellTypeOverrides[(row, col)] = _internStr(cellType)
         if comboItems:
             self.cellComboItems[(row, col)] = comboItems
         if keyToDisplay:
@@ -178,30 +224,59 @@ class TableViewModel(QAbstractTableModel):
             self.cellDisplayToKey[(row, col)] = displayToKey
         if checkboxLabels:
             self.cellCheckboxLabels[(row, col)] = checkboxLabels
+        self.clearDisplayCache()
+
+    def getComboItems(self, row: int, col: int) -> List[str]:
+        """Get combo items for a cell, falling back to its column's items."""
+        items = self.cellComboItems.get((row, col))
+        if items is None:
+            return self.columnComboItems.get(col, [])
+        return items
 
     def setKeyValue(self, row: int, col: int, keyValue: Any):
         """Set the key value for a combobox cell."""
         self.cellKeyValues[(row, col)] = keyValue
+        self.clearDisplayCache()
 
     def getKeyValue(self, row: int, col: int) -> Any:
         """Get the key value for a combobox cell."""
         return self.cellKeyValues.get((row, col))
 
+    def clearDisplayCache(self, *args):
+        """Drop cached data() results; call after changing rows or cell config directly."""
+        self._displayCache.clear()
+        self.dataRevision += 1
+
     # ===== Data Display & Editing =====
     def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
         if not index.isValid():
             return None
 
-        row = index.row()
-        col = index.column()
+        if role not in _CACHED_ROLES:
+            # Font, alignment, size hint etc. are always None; only the delegate roles remain
+            if role == _CELL_TYPE_ROLE or role == _COMBO_ITEMS_ROLE:
+                return self._cellData(index.row(), index.column(), role)
+            return None
+
+        cacheKey = (index.row(), index.column(), role)
+        try:
+            return self._displayCache[cacheKey]
+        except KeyError:
+            pass
 
+        value = self._cellData(index.row(), index.column(), role)
+        self._displayCache[cacheKey] = value
+        return value
+
+    def _cellData(self, row: int, col: int, role) -> Any:
+        """Compute data() for a cell without consulting the cache."""
         rowData = self.rows[row]
         key = self.columnKeys[col] if col < len(self.columnKeys) else None
         value = rowData.get(key) if key else None
 
         cellType = self.getCellType(row, col)
 
-        if role == Qt.DisplayRole or role == Qt.EditRole:
+        if role == _DISPLAY_ROLE or role == _EDIT_ROLE:
             if cellType == "checkbox":
                 # Return checkbox label if configured
                 labels = self.cellCheckboxLabels.get((row, col))
@@ -211,16 +286,16 @@ class TableViewModel(QAbstractTableModel):
                 return ""
             return value
 
-        if role == Qt.CheckStateRole and cellType == "checkbox":
-            return Qt.Checked if value else Qt.Unchecked
+        if role == _CHECK_STATE_ROLE and cellType == "checkbox":
+            return _CHECKED if value else _UNCHECKED
 
         # Return cell type for delegate
-        if role == Qt.UserRole:
+        if role == _CELL_TYPE_ROLE:
             return cellType
 
         # Return combo items for delegate
-        if role == Qt.UserRole + 1:
-            return self.cellComboItems.get((row, col), [])
+        if role == _COMBO_ITEMS_ROLE:
+            return self.getComboItems(row, col)
 
         return None
 
@@ -228,17 +303,46 @@ class TableViewModel(QAbstractTableModel):
         if not index.isValid():
             return False
 
-        row = index.row()
-        col = index.column()
+        if not self._storeValue(index.row(), index.column(), value, role):
+            return False
+
+        self.dataChanged.emit(index, index)
+        self.dataModified.emit()
+        return True
+
+    def setDataBlock(self, row: int, col: int, values: List[List[Any]]) -> bool:
+        """Write a block of edit values with one dataChanged for the whole rectangle.
+
+        Values that fall outside the table are dropped.
+        """
+        if not (0 <= row < len(self.rows) and 0 <= col < self.columnCount()):
+            return False
+
+        lastRow = min(row + len(values), len(self.rows)) - 1
+        lastCol = -1
+        for rowOffset, rowValues in enumerate(values[: lastRow - row + 1]):
+            for colOffset, value in enumerate(rowValues[: self.columnCount() - col]):
+                if self._storeValue(row + rowOffset, col + colOffset, value, _EDIT_ROLE):
+                    lastCol = max(lastCol, col + colOffset)
+
+        if lastCol < 0:
+            return False
+
+        self.dataChanged.emit(self.index(row, col), self.index(lastRow, lastCol))
+        self.dataModified.emit()
+        return True
+
+    def _storeValue(self, row: int, col: int, value: Any, role) -> bool:
+        """Write one cell value without emitting any signal."""
         key = self.columnKeys[col] if col < len(self.columnKeys) else None
         if not key:
             return False
 
         cellType = self.getCellType(row, col)
 
-        if cellType == "checkbox" and role == Qt.CheckStateRole:
-            self.rows[row][key] = value == Qt.Checked
-        elif role == Qt.EditRole:
+        if cellType == "checkbox" and role == _CHECK_STATE_ROLE:
+            self.rows[row][key] = value == _CHECKED
+        elif role == _EDIT_ROLE:
             self.rows[row][key] = value
             # Update key value if this is a combobox cell
             if cellType == "combobox" and (row, col) in self.cellDisplayToKey:
@@ -248,24 +352,21 @@ class TableViewModel(QAbstractTableModel):
         else:
             return False
 
-        self.dataChanged.emit(index, index)
-        self.dataModified.emit()
         return True
 
     # ===== Flags =====
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
-        base = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
         row = index.row()
         col = index.column()
         cellType = self.getCellType(row, col)
 
         if cellType == "checkbox":
-            return base | Qt.ItemIsUserCheckable
-        return base
+            return _CHECKABLE_FLAGS
+        return _BASE_FLAGS
 
     # ===== Headers =====
     def headerData(self, section: int, orientation, role=Qt.DisplayRole) -> Any:
-        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+        if role == _DISPLAY_ROLE and orientation == _HORIZONTAL:
             if section < len(self.headers):
                 return self.headers[section]
         return None
@@ -282,34 +383,37 @@ class TableViewModel(QAbstractTableModel):
         if shouldEmit:
             self.dataModified.emit()
 
+    def addRows(self, rows: List[Dict[str, Any]], shouldEmit: bool = True):
+        """Append several rows with a single insertion instead of one per row."""
+        if not rows:
+            return
+
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+        if shouldEmit:
+            self.dataModified.emit()
+
     def deleteRow(self, row: int, shouldEmit: bool = True):
         """Delete a row from the table."""
-        if row < 0 or row >= len(self.rows):
+        self.deleteRows(row, 1, shouldEmit=shouldEmit)
+
+    def deleteRows(self, row: int, count: int, shouldEmit: bool = True):
+        """Delete count consecutive rows starting at row with a single removal."""
+        if row < 0 or count <= 0 or row + count > len(self.rows):
             return
 
-        self.beginRemoveRows(QModelIndex(), row, row)
-        self.rows.pop(row)
+        last = row + count - 1
+        self.beginRemoveRows(QModelIndex(), row, last)
+        del self.rows[row : last + 1]
         self.endRemoveRows()
 
-        # Clean up cell type overrides for deleted row
-        keysToRemove = [k for k in self.cellTypeOverrides if k[0] == row]
-        for k in keysToRemove:
-            del self.cellTypeOverrides[k]
-        keysToRemove = [k for k in self.cellComboItems if k[0] == row]
-        for k in keysToRemove:
-            del self.cellComboItems[k]
-        keysToRemove = [k for k in self.cellKeyToDisplay if k[0] == row]
-        for k in keysToRemove:
-            del self.cellKeyToDisplay[k]
-        keysToRemove = [k for k in self.cellDisplayToKey if k[0] == row]
-        for k in keysToRemove:
-            del self.cellDisplayToKey[k]
-        keysToRemove = [k for k in self.cellKeyValues if k[0] == row]
-        for k in keysToRemove:
-            del self.cellKeyValues[k]
-        keysToRemove = [k for k in self.cellCheckboxLabels if k[0] == row]
-        for k in keysToRemove:
-            del self.cellCheckboxLabels[k]
+        # Clean up per-cell configuration for the deleted rows, one scan per mapping
+        for mapping in self._cellConfigMaps():
+            keysToRemove = [k for k in mapping if row <= k[0] <= last]
+            for k in keysToRemove:
+                del mapping[k]
 
         if shouldEmit:
             self.dataModified.emit()
@@ -330,16 +434,39 @@ class TableViewModel(QAbstractTableModel):
         if len(self.rows) > 0:
             self.beginRemoveRows(QModelIndex(), 0, len(self.rows) - 1)
             self.rows.clear()
-            self.cellTypeOverrides.clear()
-            self.cellComboItems.clear()
-            self.cellKeyToDisplay.clear()
-            self.cellDisplayToKey.clear()
-            self.cellKeyValues.clear()
-            self.cellCheckboxLabels.clear()
+            self._clearCellConfig()
             self.endRemoveRows()
             if shouldEmit:
                 self.dataModified.emit()
 
+    def setRows(self, rows: List[Dict[str, Any]], shouldEmit: bool = True):
+        """Replace all rows with a single model reset instead of per-row inserts."""
+        hadRows = bool(self.rows)
+        self.beginResetModel()
+        self.rows[:] = rows
+        # Like clearRows(), keep cell config set up on an empty table before the first load
+        if hadRows:
+            self._clearCellConfig()
+        self.endResetModel()
+        if shouldEmit:
+            self.dataModified.emit()
+
+    def _cellConfigMaps(self) -> Tuple[Dict[Tuple[int, int], Any], ...]:
+        """Per-cell configuration mappings, all keyed by (row, col)."""
+        return (
+            self.cellTypeOverrides,
+            self.cellComboItems,
+            self.cellKeyToDisplay,
+            self.cellDisplayToKey,
+            self.cellKeyValues,
+            self.cellCheckboxLabels,
+        )
+
+    def _clearCellConfig(self):
+        """Drop per-cell configuration, which is keyed by row index."""
+        for mapping in self._cellConfigMaps():
+            mapping.clear()
+
 
 # ---------------------------------
 # Table View Handler
@@ -561,7 +688,9 @@ class TableViewHandler(QObject):
             columns: List of (key, type) tuples where type is 'text', 'combo', or 'checkbox'
         """
         self.model.columnKeys = [col[0] for col in columns]
-        self.model.cellTypes = {i: col[1] for i, col in enumerate(columns)}
+        # Interned so the type checks in data()/setData()/flags() hit the identity fast path
+        self.model.cellTypes = {i: _internStr(col[1]) for i, col in enumerate(columns)}
+        self.model.clearDisplayCache()
         self.tableView.resizeColumnsToContents()
 
     def setColumnComboItems(self, column: int, items: List[str]):
@@ -581,7 +710,8 @@ class TableViewHandler(QObject):
             self.delegates[column] = delegate
             self.tableView.setItemDelegateForColumn(column, delegate)
 
-        self.model.cellTypes[column] = cellType
+        self.model.cellTypes[column] = _internStr(cellType)
+        self.model.clearDisplayCache()
 
     def enableMultiTypeCells(self):
         """Enable per-cell type support using MultiTypeCellDelegate."""
@@ -770,6 +900,7 @@ class TableViewHandler(QObject):
             # Add the default row
             self.model.addRow(defaultRow)
 
+        self.model.clearDisplayCache()
         self.tableView.resizeColumnsToContents()
         self.rowCountChanged.emit(self.model.rowCount())
 
@@ -925,6 +1056,8 @@ class TableViewHandler(QObject):
                             rowIdx
                         ]
 
+        # Cell metadata above was written after the rows were inserted
+        self.model.clearDisplayCache()
         self.tableView.resizeColumnsToContents()
         self.rowCountChanged.emit(self.model.rowCount())
 
@@ -959,18 +1092,30 @@ class TableViewHandler(QObject):
             the selected item is {1: "C"} with key=1.
         """
         self.enableMultiTypeCells()
-        self.model.clearRows()
 
         # Ensure columnKeys is set from headers if not already set
         if not self.model.columnKeys and self.model.headers:
             self.model.columnKeys = list(self.model.headers)
 
+        # Rows and per-cell config are collected first and applied with one model reset
+        rowKeys = self.model.columnKeys[:3]
+        rows = []
+        cellTypeOverrides = {}
+        cellComboItems = {}
+        cellKeyToDisplay = {}
+        cellDisplayToKey = {}
+        cellCheckboxLabels = {}
+        cellKeyValues = {}
+        # id(items) -> parsed combo lists, so rows sharing one items list (a YAML alias)
+        # share one parse; config keeps every list alive for the whole load
+        parsedItems = {}
+
         for rowIdx, item in enumerate(config):
-            name = item.get("name", "")
+            name = _internStr(item.get("name", ""))
             itemType = item.get("type", "editable")
             defaultValueIndex = item.get("defaultValueIndex", "")
             items = item.get("items", [])
-            description = item.get("description", "")
+            description = _internStr(item.get("description", ""))
             # Checkbox labels
             checkedLabel = item.get("checkedLabel", None)
             uncheckedLabel = item.get("uncheckedLabel", None)
@@ -989,19 +1134,23 @@ class TableViewHandler(QObject):
             displayToKey = {}  # Maps display text to key
             itemsList = []  # List of (key, value) tuples in order
 
-            if items and cellType == "combobox":
+            if items and cellType == "combobox" and id(items) in parsedItems:
+                comboItems, keyToDisplay, displayToKey, itemsList = parsedItems[id(items)]
+            elif items and cellType == "combobox":
+                parsedItems[id(items)] = (comboItems, keyToDisplay, displayToKey, itemsList)
                 for itemDict in items:
                     for key, val in itemDict.items():
                         keyInt = int(key)
                         itemsList.append((keyInt, val))
 
-                        # Format combo item based on display mode
+                        # Format combo item based on display mode; interned so the many
+                        # rows sharing the same item text share one string object
                         if comboDisplayMode == "key":
-                            displayText = str(key)
+                            displayText = intern(str(key))
                         elif comboDisplayMode == "both":
-                            displayText = f"{key}: {val}"
+                            displayText = intern(f"{key}: {val}")
                         else:  # "value" (default)
-                            displayText = val
+                            displayText = _internStr(val)
 
                         comboItems.append(displayText)
                         keyToDisplay[keyInt] = displayText
@@ -1017,37 +1166,35 @@ class TableViewHandler(QObject):
                     actualKeyValue = itemsList[defaultValueIndex][0]  # The key
                     displayValue = keyToDisplay.get(actualKeyValue, str(actualKeyValue))
 
-            # Build row data based on column keys
-            rowData = {}
-            if len(self.model.columnKeys) >= 1:
-                rowData[self.model.columnKeys[0]] = name
-            if len(self.model.columnKeys) >= 2:
-                rowData[self.model.columnKeys[1]] = displayValue
-            if len(self.model.columnKeys) >= 3:
-                rowData[self.model.columnKeys[2]] = description
-
-            # Add the row
-            self.model.addRow(rowData)
-
-            # Build checkbox labels tuple if provided
-            checkboxLabels = None
-            if cellType == "checkbox" and (checkedLabel or uncheckedLabel):
-                checkboxLabels = (checkedLabel or "", uncheckedLabel or "")
+            # Build row data from the first three column keys; zip stops at the shorter side
+            rows.append(dict(zip(rowKeys, (name, displayValue, description))))
 
             # Set cell type for the value column with mappings
-            self.model.setCellType(
-                rowIdx,
-                valueColumn,
-                cellType,
-                comboItems,
-                keyToDisplay=keyToDisplay,
-                displayToKey=displayToKey,
-                checkboxLabels=checkboxLabels,
-            )
+            cell = (rowIdx, valueColumn)
+            cellTypeOverrides[cell] = _internStr(cellType)
+            if comboItems:
+                cellComboItems[cell] = comboItems
+            if keyToDisplay:
+                cellKeyToDisplay[cell] = keyToDisplay
+            if displayToKey:
+                cellDisplayToKey[cell] = displayToKey
+            if cellType == "checkbox" and (checkedLabel or uncheckedLabel):
+                cellCheckboxLabels[cell] = (checkedLabel or "", uncheckedLabel or "")
 
             # Store the actual key value
             if actualKeyValue is not None:
-                self.model.setKeyValue(rowIdx, valueColumn, actualKeyValue)
+                cellKeyValues[cell] = actualKeyValue
+
+        # setRows drops the old per-cell config, so the new config is applied after it
+        self.model.setRows(rows, shouldEmit=False)
+        self.model.cellTypeOverrides.update(cellTypeOverrides)
+        self.model.cellComboItems.update(cellComboItems)
+        self.model.cellKeyToDisplay.update(cellKeyToDisplay)
+        self.model.cellDisplayToKey.update(cellDisplayToKey)
+        self.model.cellCheckboxLabels.update(cellCheckboxLabels)
+        self.model.cellKeyValues.update(cellKeyValues)
+        self.model.clearDisplayCache()
+        self.model.dataModified.emit()
 
         self.tableView.resizeColumnsToContents()
         self.rowCountChanged.emit(self.model.rowCount())
@@ -1182,12 +1329,9 @@ class TableViewHandler(QObject):
                 self.rowCountChanged.emit(self.model.rowCount())
 
         elif currentCount > targetCount:
-            # Remove rows from the end
+            # Remove rows from the end in one removal
             rowsToRemove = currentCount - targetCount
-            for _ in range(rowsToRemove):
-                # Always remove the last row
-                lastRowIdx = len(self.model.rows) - 1
-                self.model.deleteRow(lastRowIdx, shouldEmit=False)
+            self.model.deleteRows(targetCount, rowsToRemove, shouldEmit=False)
 
             # Emit signals once at the end if needed
             if shouldEmit:
@@ -1754,6 +1898,9 @@ class TableViewHandler(QObject):
                 # Text cell - use value directly
                 self.model.rows[rowIdx][valueKey] = value
 
+        # Rows were written directly, so drop cached data() even when nothing is emitted
+        self.model.clearDisplayCache()
+
         # Notify that data changed (only if shouldEmit is True)
         if shouldEmit and self.model.rows:
             topLeft = self.model.index(0, 0)
@@ -1777,22 +1924,18 @@ class TableViewHandler(QObject):
             It will automatically copy cell type metadata (combobox items, mappings, etc.)
             from the column configuration to each loaded row.
         """
-        self.model.clearRows(shouldEmit)
+        # One model reset for the whole load rather than a clear plus an insert per row
+        self.model.setRows(data, shouldEmit=False)
 
         for rowIdx, rowData in enumerate(data):
-            self.model.addRow(rowData, shouldEmit=shouldEmit)
-
             # Copy cell type metadata from column configuration to this row
             # This ensures combobox and checkbox cells work correctly
             for colIdx in range(len(self.model.columnKeys)):
                 cellType = self.model.cellTypes.get(colIdx)
 
                 if cellType == "combobox":
-                    # Copy combo metadata from column configuration
-                    if colIdx in self.model.columnComboItems:
-                        self.model.cellComboItems[(rowIdx, colIdx)] = self.model.columnComboItems[
-                            colIdx
-                        ]
+                    # Copy key mappings from column configuration; combo items are not
+                    # copied since getComboItems falls back to columnComboItems
                     if colIdx in self.model.columnKeyToDisplay:
                         self.model.cellKeyToDisplay[(rowIdx, colIdx)] = (
                             self.model.columnKeyToDisplay[colIdx]
@@ -1845,8 +1988,9 @@ class TableViewHandler(QObject):
             bottomRight = self.model.index(len(self.model.rows) - 1, self.model.columnCount() - 1)
             self.model.dataChanged.emit(topLeft, bottomRight)
 
-        # Only emit rowCountChanged if shouldEmit is True
+        # Only emit dataModified/rowCountChanged if shouldEmit is True
         if shouldEmit:
+            self.model.dataModified.emit()
             self.rowCountChanged.emit(self.model.rowCount())
 
     def addRow(self, rowData: Dict[str, Any] = None, shouldEmit: bool = True):
@@ -1861,6 +2005,18 @@ class TableViewHandler(QObject):
         if shouldEmit:
             self.rowCountChanged.emit(self.model.rowCount())
 
+    def addRows(self, rows: List[Dict[str, Any]], shouldEmit: bool = True):
+        """Append several rows at once.
+
+        Args:
+            rows: List of dictionaries with row data
+            shouldEmit: If True, emit signals after adding (default True).
+                       Set to False to prevent triggering callbacks.
+        """
+        self.model.addRows(rows, shouldEmit=shouldEmit)
+        if shouldEmit:
+            self.rowCountChanged.emit(self.model.rowCount())
+
     def deleteRow(self, row: int, shouldEmit: bool = True):
         """Delete a specific row.
 
@@ -1918,6 +2074,7 @@ class TableViewHandler(QObject):
         """
         if 0 <= row < len(self.model.rows):
             self.model.rows[row].update(data)
+            self.model.clearDisplayCache()
             # Emit data changed for entire row if requested
             if shouldEmit:
                 topLeft = self.model.index(row, 0)
@@ -1945,7 +2102,17 @@ class TableViewHandler(QObject):
             return np.array([])
 
         key = self.model.columnKeys[column]
-        values = [row.get(key) for row in self.model.rows]
+        rows = self.model.rows
+
+        if np.dtype(dtype).itemsize:
+            try:
+                # Fill the array straight from the rows, without an intermediate list
+                return np.fromiter((row.get(key) for row in rows), dtype=dtype, count=len(rows))
+            except (ValueError, TypeError):
+                # np.array(values, dtype) would fail on the same element; skip the retry
+                return np.array([row.get(key) for row in rows])
+
+        values = [row.get(key) for row in rows]
 
         try:
             return np.array(values, dtype=dtype)
@@ -1966,13 +2133,23 @@ class TableViewHandler(QObject):
 
     def getAllAsNumpy(self, dtype=float) -> np.ndarray:
         """Get all table data as 2D numpy array."""
-        if not self.model.rows:
+        rows = self.model.rows
+        if not rows:
             return np.array([])
 
-        data = []
-        for row in self.model.rows:
-            values = list(row.values())
-            data.append(values)
+        width = len(rows[0])
+        if np.dtype(dtype).itemsize and all(len(row) == width for row in rows):
+            try:
+                # Fill a flat buffer in one pass and reshape it, skipping the list of lists.
+                # This also covers dtype=object, which boxes each value once.
+                values = chain.from_iterable(row.values() for row in rows)
+                flat = np.fromiter(values, dtype=dtype, count=len(rows) * width)
+                return flat.reshape(len(rows), width)
+            except (ValueError, TypeError):
+                # np.array(data, dtype) would fail on the same element; skip the retry
+                return np.array([list(row.values()) for row in rows])
+
+        data = [list(row.values()) for row in rows]
 
         try:
             return np.array(data, dtype=dtype)
@@ -1987,11 +2164,8 @@ class TableViewHandler(QObject):
         if columnKeys is None:
             columnKeys = self.model.columnKeys
 
-        self.model.clearRows()
-
-        for row in array:
-            rowData = {key: value for key, value in zip(columnKeys, row)}
-            self.model.addRow(rowData)
+        # tolist() unboxes the array in one pass; setRows() replaces the rows in one reset
+        self.model.setRows([dict(zip(columnKeys, row)) for row in array.tolist()])
 
     # ===== Properties =====
 
@@ -2054,18 +2228,8 @@ class TableViewHandler(QObject):
 
         lines = text.strip().split("\n")
 
-        for rowOffset, line in enumerate(lines):
-            currentRow = startRow + rowOffset
-            if currentRow >= self.model.rowCount():
-                break
-
-            values = line.split("\t")
-            for colOffset, value in enumerate(values):
-                currentCol = startCol + colOffset
-                if currentCol >= self.model.columnCount():
-                    break
-
-                self.setCellValue(currentRow, currentCol, value)
+        # One dataChanged/dataModified for the pasted block instead of one per cell
+        self.model.setDataBlock(startRow, startCol, [line.split("\t") for line in lines])
 
     # ===== Callbacks =====
 
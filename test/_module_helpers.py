@@ -0,0 +1,40 @@
+"""
+Route and module builders shared by the NaysModule tests.
+
+Plain functions rather than fixtures so test modules can build their read-only
+routes and decorated modules once, at import time.
+"""
+
+from nays import NaysModule
+from nays.core.route import Route, RouteType
+
+
+class MockView:
+    """Mock view component for testing"""
+
+    __slots__ = ("routeData", "view")
+
+    def __init__(self, routeData=None):
+        self.routeData = routeData
+        self.view = self
+
+    def show(self):
+        pass
+
+    def exec(self):
+        pass
+
+
+def make_route(name, path, routeType=RouteType.WINDOW):
+    """Build a Route targeting MockView"""
+    return Route(name=name, path=path, component=MockView, routeType=routeType)
+
+
+def build_module(routes=(), providers=(), imports=(), exports=()):
+    """Decorate a fresh class with the given module metadata"""
+
+    @NaysModule(providers=providers, imports=imports, exports=exports, routes=routes)
+    class GeneratedModule:
+        pass
+
+    return GeneratedModule
@@ -0,0 +1,12 @@
+"""
+Shared QApplication for test modules that run outside pytest fixtures.
+
+Importing this module creates the application on first import and reuses it
+afterwards. Only argv[0] is passed so Qt never parses pytest's own options.
+"""
+
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication(sys.argv[:1])
@@ -0,0 +1,55 @@
+"""
+Shared pytest fixtures for the nays test suite.
+"""
+
+import pytest
+
+from nays import ModuleFactory
+from nays.core.router import Router
+
+# Test modules that build Qt widgets in most of their cases. They run by default
+# (with QT_QPA_PLATFORM=offscreen when there is no display); -m "not gui" skips them.
+# Marked here rather than with pytestmark so the unittest-style ones run without pytest.
+_GUI_MODULES = frozenset(
+    {
+        "test_checkbox_labels.py",
+        "test_save_cancel_callbacks.py",
+        "test_table_editor.py",
+        "test_table_view_handler.py",
+        "test_table_view_yaml_config.py",
+        "test_toolbar_fix.py",
+        "test_transform_existing_table.py",
+    }
+)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """Mark items from the Qt widget modules as gui so -m can select them"""
+    for item in items:
+        if item.path.name in _GUI_MODULES:
+            item.add_marker(pytest.mark.gui)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Single QApplication shared by every Qt-backed test"""
+    from _qt_fixture import app
+
+    yield app
+
+
+def _build_router(module):
+    """Build a Router over a ModuleFactory rooted at module"""
+    factory = ModuleFactory()
+    factory.register(module)
+    factory.initialize()
+    router = Router(factory.injector)
+    router.registerRoutes(factory.getRoutes())
+    return router
+
+
+@pytest.fixture(scope="session")
+def make_router():
+    """Router factory; share the result through a module-scoped fixture where needed"""
+    return _build_router
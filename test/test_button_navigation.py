@@ -5,9 +5,6 @@ This verifies the core functionality requested: button clicks navigate to other
 """
 
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from PySide6.QtWidgets import QApplication
 
@@ -1,11 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 from typing import Type
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from injector import Injector
 
 from nays import ModuleFactory, NaysModule, NaysModuleBase, Provider
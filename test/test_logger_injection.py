@@ -1,13 +1,8 @@
 import logging
-import sys
 import unittest
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import Union
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from nays import ModuleFactory, NaysModule, Provider
 from nays.core.lifecycle import OnInit
 from nays.core.logger import setupLogger
@@ -9,13 +9,8 @@ This test verifies that:
 5. Lifecycle hooks properly log their events
 """
 
-import sys
 import unittest
 from abc import ABC, abstractmethod
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from injector import Injector
 
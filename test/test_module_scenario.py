@@ -1,12 +1,7 @@
-import sys
 import unittest
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import Type
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from injector import Injector
 
 from nays import ModuleFactory, NaysModule, NaysModuleBase, Provider
@@ -1,11 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 from typing import Type
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from nays import ModuleMetadata, NaysModule, NaysModuleBase, Provider
 from nays.core.route import Route
 
@@ -41,11 +36,11 @@ class TestNaysModuleDecorator(unittest.TestCase):
         # Check if the class inherits from NaysModuleBase
         self.assertTrue(issubclass(SimpleModule, NaysModuleBase))
 
-        # Check if metadata is initialized with empty lists
-        self.assertEqual(SimpleModule.providers, [])
-        self.assertEqual(SimpleModule.imports, [])
-        self.assertEqual(SimpleModule.exports, [])
-        self.assertEqual(SimpleModule.routes, [])
+        # Check if metadata is initialized with empty tuples
+        self.assertEqual(SimpleModule.providers, ())
+        self.assertEqual(SimpleModule.imports, ())
+        self.assertEqual(SimpleModule.exports, ())
+        self.assertEqual(SimpleModule.routes, ())
 
     def test_decorator_with_exports(self):
         """Test decorator with exports parameter"""
@@ -55,10 +50,10 @@ class TestNaysModuleDecorator(unittest.TestCase):
             pass
 
         self.assertTrue(issubclass(ExportModule, NaysModuleBase))
-        self.assertEqual(ExportModule.exports, [TestProvider])
-        self.assertEqual(ExportModule.providers, [])
-        self.assertEqual(ExportModule.imports, [])
-        self.assertEqual(ExportModule.routes, [])
+        self.assertEqual(ExportModule.exports, (TestProvider,))
+        self.assertEqual(ExportModule.providers, ())
+        self.assertEqual(ExportModule.imports, ())
+        self.assertEqual(ExportModule.routes, ())
 
     def test_decorator_with_providers(self):
         """Test decorator with providers parameter"""
@@ -85,7 +80,7 @@ class TestNaysModuleDecorator(unittest.TestCase):
             pass
 
         self.assertTrue(issubclass(MainModule, NaysModuleBase))
-        self.assertEqual(MainModule.imports, [ImportedModule])
+        self.assertEqual(MainModule.imports, (ImportedModule,))
 
     def test_decorator_with_routes(self):
         """Test decorator with routes parameter"""
@@ -120,8 +115,8 @@ class TestNaysModuleDecorator(unittest.TestCase):
 
         self.assertTrue(issubclass(CompleteModule, NaysModuleBase))
         self.assertEqual(len(CompleteModule.providers), 2)
-        self.assertEqual(CompleteModule.imports, [ImportedModule])
-        self.assertEqual(CompleteModule.exports, [TestProvider])
+        self.assertEqual(CompleteModule.imports, (ImportedModule,))
+        self.assertEqual(CompleteModule.exports, (TestProvider,))
         self.assertEqual(len(CompleteModule.routes), 1)
 
     def test_get_metadata(self):
@@ -134,10 +129,10 @@ class TestNaysModuleDecorator(unittest.TestCase):
         metadata = MetadataModule.getMetadata()
 
         self.assertIsInstance(metadata, ModuleMetadata)
-        self.assertEqual(metadata.exports, [TestProvider])
-        self.assertEqual(metadata.providers, [])
-        self.assertEqual(metadata.imports, [])
-        self.assertEqual(metadata.routes, [])
+        self.assertEqual(metadata.exports, (TestProvider,))
+        self.assertEqual(metadata.providers, ())
+        self.assertEqual(metadata.imports, ())
+        self.assertEqual(metadata.routes, ())
 
     def test_register_method(self):
         """Test register method"""
@@ -156,8 +151,8 @@ class TestNaysModuleDecorator(unittest.TestCase):
         self.assertEqual(result, RegisterModule)
 
         # Check that metadata was updated
-        self.assertEqual(RegisterModule.providers, [TestProvider])
-        self.assertEqual(RegisterModule.exports, [TestService])
+        self.assertEqual(RegisterModule.providers, (TestProvider,))
+        self.assertEqual(RegisterModule.exports, (TestService,))
 
     def test_module_inheritance(self):
         """Test that decorated class inherits from NaysModuleBase"""
@@ -187,8 +182,8 @@ class TestNaysModuleDecorator(unittest.TestCase):
             pass
 
         # Check that modules have separate metadata
-        self.assertEqual(ModuleA.exports, [TestProvider])
-        self.assertEqual(ModuleB.exports, [TestService])
+        self.assertEqual(ModuleA.exports, (TestProvider,))
+        self.assertEqual(ModuleB.exports, (TestService,))
 
         # Check that they are independent
         self.assertNotEqual(ModuleA.exports, ModuleB.exports)
@@ -212,10 +207,10 @@ class TestNaysModuleDecorator(unittest.TestCase):
 
         instance = MethodModule()
         self.assertEqual(instance.custom_method(), "custom")
-        self.assertEqual(MethodModule.exports, [TestProvider])
+        self.assertEqual(MethodModule.exports, (TestProvider,))
 
     def test_empty_lists_are_separate_instances(self):
-        """Test that each module gets its own list instances"""
+        """Test that each module gets its own metadata"""
 
         @NaysModule()
         class Module1:
@@ -225,8 +220,8 @@ class TestNaysModuleDecorator(unittest.TestCase):
         class Module2:
             pass
 
-        # Modify Module1's providers
-        Module1.providers.append(TestProvider)
+        # Replace Module1's providers
+        Module1.register(ModuleMetadata(providers=[TestProvider]))
 
         # Module2's providers should remain empty
         self.assertEqual(len(Module1.providers), 1)
@@ -1,277 +1,219 @@
-import sys
-import unittest
-from pathlib import Path
-from typing import Type
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+from _module_helpers import MockView, build_module, make_route
 
 from nays import ModuleMetadata, NaysModule, NaysModuleBase, Provider
-from nays.core.route import Route, RouteType
-
-
-class MockView:
-    """Mock view component for testing"""
-
-    def __init__(self, routeData=None):
-        self.routeData = routeData
-        self.view = self
-
-    def show(self):
-        pass
-
-    def exec(self):
-        pass
-
-
-class TestNaysModuleWithRoutes(unittest.TestCase):
-    """Test cases for NaysModule decorator with routes"""
-
-    def test_module_with_single_route(self):
-        """Test module with a single route"""
-        route = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
+from nays.core.route import RouteType
 
-        @NaysModule(routes=[route])
-        class HomeModule:
-            pass
+ROUTE_FIELDS = ("name", "path", "routeType")
 
-        self.assertTrue(issubclass(HomeModule, NaysModuleBase))
-        self.assertEqual(len(HomeModule.routes), 1)
-        self.assertEqual(HomeModule.routes[0], route)
-        self.assertEqual(HomeModule.routes[0].path, "/home")
-        self.assertEqual(HomeModule.routes[0].name, "home")
 
-    def test_module_with_multiple_routes(self):
-        """Test module with multiple routes"""
-        homeRoute = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
+def route_fields(route):
+    """Structural view of a route for single-compare assertions"""
+    return {field: getattr(route, field) for field in ROUTE_FIELDS}
 
-        aboutRoute = Route(
-            name="about", path="/about", component=MockView, routeType=RouteType.WIDGET
-        )
 
-        settingsRoute = Route(
-            name="settings", path="/settings", component=MockView, routeType=RouteType.DIALOG
-        )
+class UserService:
+    """Service class used as a provider token"""
 
-        @NaysModule(routes=[homeRoute, aboutRoute, settingsRoute])
-        class MainModule:
-            pass
+    pass
 
-        self.assertEqual(len(MainModule.routes), 3)
-        self.assertEqual(MainModule.routes[0].path, "/home")
-        self.assertEqual(MainModule.routes[1].path, "/about")
-        self.assertEqual(MainModule.routes[2].path, "/settings")
 
-    def test_route_type_window(self):
-        """Test route with WINDOW type"""
-        route = Route(
-            name="main_window", path="/main", component=MockView, routeType=RouteType.WINDOW
-        )
+class SharedService:
+    """Service class used as an export token"""
 
-        @NaysModule(routes=[route])
-        class WindowModule:
-            pass
+    pass
 
-        self.assertEqual(WindowModule.routes[0].routeType, RouteType.WINDOW)
 
-    def test_route_type_dialog(self):
-        """Test route with DIALOG type"""
-        route = Route(name="dialog", path="/dialog", component=MockView, routeType=RouteType.DIALOG)
+# ============ Shared Routes and Modules ============
+# Read-only tests share routes and decorated modules built once at import.
+# Tests that register() new metadata build their own with build_module().
 
-        @NaysModule(routes=[route])
-        class DialogModule:
-            pass
+HOME_ROUTE = make_route("home", "/home", RouteType.WINDOW)
+ABOUT_ROUTE = make_route("about", "/about", RouteType.WIDGET)
+SETTINGS_ROUTE = make_route("settings", "/settings", RouteType.DIALOG)
+DASHBOARD_ROUTE = make_route("dashboard", "/dashboard", RouteType.WIDGET)
 
-        self.assertEqual(DialogModule.routes[0].routeType, RouteType.DIALOG)
+USER_SERVICE_PROVIDER = Provider(provide=UserService, useClass=UserService)
 
-    def test_route_type_widget(self):
-        """Test route with WIDGET type"""
-        route = Route(name="widget", path="/widget", component=MockView, routeType=RouteType.WIDGET)
+# register() copies the lists into tuples, so one instance can be shared
+REGISTER_METADATA = ModuleMetadata(routes=[make_route("new_route", "/new", RouteType.DIALOG)])
 
-        @NaysModule(routes=[route])
-        class WidgetModule:
-            pass
 
-        self.assertEqual(WidgetModule.routes[0].routeType, RouteType.WIDGET)
+@NaysModule(routes=[HOME_ROUTE])
+class _HomeModule:
+    pass
 
-    def test_module_with_routes_and_providers(self):
-        """Test module with both routes and providers"""
-        route = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
 
-        class UserService:
-            pass
+@NaysModule(routes=[SETTINGS_ROUTE])
+class _SettingsModule:
+    pass
 
-        provider = Provider(provide=UserService, useClass=UserService)
 
-        @NaysModule(providers=[provider], routes=[route])
-        class FullModule:
-            pass
+@NaysModule(routes=[])
+class _SharedModule:
+    pass
 
-        self.assertEqual(len(FullModule.routes), 1)
-        self.assertEqual(len(FullModule.providers), 1)
-        self.assertEqual(FullModule.routes[0].path, "/home")
-        self.assertEqual(FullModule.providers[0], provider)
 
-    def test_module_with_routes_and_imports(self):
-        """Test module with routes and imports"""
-        route = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
+@NaysModule(providers=[USER_SERVICE_PROVIDER], routes=[HOME_ROUTE])
+class _RoutesAndProvidersModule:
+    pass
 
-        @NaysModule(routes=[])
-        class SharedModule:
-            pass
 
-        @NaysModule(imports=[SharedModule], routes=[route])
-        class MainModule:
-            pass
+@NaysModule(imports=[_SharedModule], routes=[HOME_ROUTE])
+class _RoutesAndImportsModule:
+    pass
 
-        self.assertEqual(len(MainModule.routes), 1)
-        self.assertEqual(len(MainModule.imports), 1)
-        self.assertEqual(MainModule.imports[0], SharedModule)
 
-    def test_module_with_routes_and_exports(self):
-        """Test module with routes and exports"""
-        route = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
+@NaysModule(exports=[SharedService], routes=[HOME_ROUTE])
+class _RoutesAndExportsModule:
+    pass
 
-        class SharedService:
-            pass
 
-        @NaysModule(exports=[SharedService], routes=[route])
-        class ExportModule:
-            pass
+@NaysModule(
+    providers=[USER_SERVICE_PROVIDER],
+    imports=[_SharedModule],
+    exports=[UserService],
+    routes=[HOME_ROUTE, DASHBOARD_ROUTE],
+)
+class _CompleteModule:
+    pass
 
-        self.assertEqual(len(ExportModule.routes), 1)
-        self.assertEqual(len(ExportModule.exports), 1)
-        self.assertEqual(ExportModule.exports[0], SharedService)
 
-    def test_module_with_all_metadata_and_routes(self):
-        """Test module with all metadata types including routes"""
-        route1 = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
+def _routes_case(specs, id):
+    """Parametrize entry of (specs, routes, module) with the module decorated once"""
+    routes = [make_route(name, path, rtype) for name, path, rtype in specs]
+    return pytest.param(specs, routes, build_module(routes=routes), id=id)
 
-        route2 = Route(
-            name="dashboard", path="/dashboard", component=MockView, routeType=RouteType.WIDGET
-        )
 
-        @NaysModule()
-        class ImportedModule:
-            pass
+_TYPED_ROUTE_CASES = [
+    _routes_case([spec], spec[0])
+    for spec in (
+        ("main_window", "/main", RouteType.WINDOW),
+        ("dialog", "/dialog", RouteType.DIALOG),
+        ("widget", "/widget", RouteType.WIDGET),
+    )
+]
 
-        class UserService:
-            pass
+_ROUTES_CASES = [
+    _routes_case([("home", "/home", RouteType.WINDOW)], "single"),
+    _routes_case(
+        [
+            ("home", "/home", RouteType.WINDOW),
+            ("about", "/about", RouteType.WIDGET),
+            ("settings", "/settings", RouteType.DIALOG),
+        ],
+        "multiple",
+    ),
+    _routes_case([("user_profile", "/user/:id", RouteType.WINDOW)], "path_param"),
+]
 
-        provider = Provider(provide=UserService, useClass=UserService)
 
-        @NaysModule(
-            providers=[provider],
-            imports=[ImportedModule],
-            exports=[UserService],
-            routes=[route1, route2],
-        )
-        class CompleteModule:
-            pass
+# ============ Routes in NaysModule ============
 
-        self.assertEqual(len(CompleteModule.routes), 2)
-        self.assertEqual(len(CompleteModule.providers), 1)
-        self.assertEqual(len(CompleteModule.imports), 1)
-        self.assertEqual(len(CompleteModule.exports), 1)
-        self.assertEqual(CompleteModule.routes[0].path, "/home")
-        self.assertEqual(CompleteModule.routes[1].path, "/dashboard")
 
-    def test_route_component_instantiation(self):
-        """Test that route component can be instantiated"""
-        route = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
+@pytest.mark.parametrize("specs,routes,module", _TYPED_ROUTE_CASES)
+def test_route_type(specs, routes, module):
+    """Test route with each RouteType"""
+    assert route_fields(module.routes[0]) == dict(zip(ROUTE_FIELDS, specs[0]))
 
-        @NaysModule(routes=[route])
-        class ComponentModule:
-            pass
 
-        # Verify component can be instantiated
-        component_instance = ComponentModule.routes[0].component()
-        self.assertIsInstance(component_instance, MockView)
+@pytest.mark.parametrize("specs,routes,module", _ROUTES_CASES)
+def test_module_with_routes(specs, routes, module):
+    """Test module with one or more routes, checking name and path properties"""
+    assert NaysModuleBase in module.__mro__
+    assert list(module.routes) == routes
+    assert [route_fields(r) for r in module.routes] == [
+        dict(zip(ROUTE_FIELDS, spec)) for spec in specs
+    ]
 
-    def test_routes_metadata_in_getMetadata(self):
-        """Test that routes are included in getMetadata"""
-        route = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
 
-        @NaysModule(routes=[route])
-        class MetadataModule:
-            pass
+def test_module_with_routes_and_providers():
+    """Test module with both routes and providers"""
+    assert len(_RoutesAndProvidersModule.routes) == 1
+    assert len(_RoutesAndProvidersModule.providers) == 1
+    assert _RoutesAndProvidersModule.routes[0].path == "/home"
+    assert _RoutesAndProvidersModule.providers[0] == USER_SERVICE_PROVIDER
 
-        metadata = MetadataModule.getMetadata()
 
-        self.assertIsInstance(metadata, ModuleMetadata)
-        self.assertEqual(len(metadata.routes), 1)
-        self.assertEqual(metadata.routes[0].path, "/home")
+def test_module_with_routes_and_imports():
+    """Test module with routes and imports"""
+    assert len(_RoutesAndImportsModule.routes) == 1
+    assert len(_RoutesAndImportsModule.imports) == 1
+    assert _RoutesAndImportsModule.imports[0] == _SharedModule
 
-    def test_routes_in_register_method(self):
-        """Test that routes are updated via register method"""
 
-        @NaysModule(routes=[])
-        class RegisterModule:
-            pass
+def test_module_with_routes_and_exports():
+    """Test module with routes and exports"""
+    assert len(_RoutesAndExportsModule.routes) == 1
+    assert len(_RoutesAndExportsModule.exports) == 1
+    assert _RoutesAndExportsModule.exports[0] == SharedService
 
-        route = Route(name="new_route", path="/new", component=MockView, routeType=RouteType.DIALOG)
 
-        new_metadata = ModuleMetadata(routes=[route])
-        RegisterModule.register(new_metadata)
+def test_module_with_all_metadata_and_routes():
+    """Test module with all metadata types including routes"""
+    expected = {
+        "routes": 2,
+        "providers": 1,
+        "imports": 1,
+        "exports": 1,
+        "route_paths": ["/home", "/dashboard"],
+    }
+    actual = {
+        "routes": len(_CompleteModule.routes),
+        "providers": len(_CompleteModule.providers),
+        "imports": len(_CompleteModule.imports),
+        "exports": len(_CompleteModule.exports),
+        "route_paths": [r.path for r in _CompleteModule.routes],
+    }
+    assert actual == expected
 
-        self.assertEqual(len(RegisterModule.routes), 1)
-        self.assertEqual(RegisterModule.routes[0].path, "/new")
 
-    def test_multiple_modules_with_different_routes(self):
-        """Test that multiple modules can have different routes"""
-        homeRoute = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
+def test_route_component_instantiation():
+    """Test that route component can be instantiated"""
+    # Verify component can be instantiated
+    component_instance = _HomeModule.routes[0].component()
+    assert isinstance(component_instance, MockView)
 
-        settingsRoute = Route(
-            name="settings", path="/settings", component=MockView, routeType=RouteType.DIALOG
-        )
 
-        @NaysModule(routes=[homeRoute])
-        class HomeModule:
-            pass
+def test_routes_metadata_in_getMetadata():
+    """Test that routes are included in getMetadata"""
+    metadata = _HomeModule.getMetadata()
 
-        @NaysModule(routes=[settingsRoute])
-        class SettingsModule:
-            pass
+    assert isinstance(metadata, ModuleMetadata)
+    assert len(metadata.routes) == 1
+    assert metadata.routes[0].path == "/home"
 
-        self.assertEqual(len(HomeModule.routes), 1)
-        self.assertEqual(len(SettingsModule.routes), 1)
-        self.assertEqual(HomeModule.routes[0].path, "/home")
-        self.assertEqual(SettingsModule.routes[0].path, "/settings")
 
-    def test_route_name_and_path_properties(self):
-        """Test route name and path properties"""
-        route = Route(
-            name="user_profile", path="/user/:id", component=MockView, routeType=RouteType.WINDOW
-        )
+def test_routes_in_register_method():
+    """Test that routes are updated via register method"""
+    RegisterModule = build_module(routes=[])
 
-        @NaysModule(routes=[route])
-        class RoutePropertiesModule:
-            pass
+    RegisterModule.register(REGISTER_METADATA)
 
-        self.assertEqual(RoutePropertiesModule.routes[0].name, "user_profile")
-        self.assertEqual(RoutePropertiesModule.routes[0].path, "/user/:id")
+    assert len(RegisterModule.routes) == 1
+    assert RegisterModule.routes[0].path == "/new"
 
-    def test_module_routes_independence(self):
-        """Test that module routes are independent"""
-        route1 = Route(name="home", path="/home", component=MockView, routeType=RouteType.WINDOW)
 
-        route2 = Route(name="about", path="/about", component=MockView, routeType=RouteType.WIDGET)
+def test_multiple_modules_with_different_routes():
+    """Test that multiple modules can have different routes"""
+    assert len(_HomeModule.routes) == 1
+    assert len(_SettingsModule.routes) == 1
+    assert _HomeModule.routes[0].path == "/home"
+    assert _SettingsModule.routes[0].path == "/settings"
 
-        @NaysModule(routes=[route1])
-        class Module1:
-            pass
 
-        @NaysModule(routes=[route2])
-        class Module2:
-            pass
+def test_module_routes_independence():
+    """Test that module routes are independent"""
+    Module1 = build_module(routes=[HOME_ROUTE])
+    Module2 = build_module(routes=[ABOUT_ROUTE])
 
-        # Modify Module1 routes
-        Module1.routes.append(route2)
+    # Modify Module1 routes
+    Module1.register(ModuleMetadata(routes=[HOME_ROUTE, ABOUT_ROUTE]))
 
-        # Module2 should not be affected
-        self.assertEqual(len(Module1.routes), 2)
-        self.assertEqual(len(Module2.routes), 1)
+    # Module2 should not be affected
+    assert len(Module1.routes) == 2
+    assert len(Module2.routes) == 1
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
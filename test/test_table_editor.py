@@ -171,6 +171,48 @@ class TestCreateTableEditor:
         assert isinstance(exported, np.ndarray)
         assert exported.shape == (2, 3)
 
+    def test_export_as_numpy_cached_until_edit(self, qt_app):
+        """Test that the numpy export follows table changes and stays writable"""
+        headers = ["X", "Y"]
+        editor = createTableEditor(headers=headers, data=np.array([[1, 2], [3, 4]]))
+
+        exported = editor.getDataAsNumpy()
+        exported[0, 0] = 0
+        assert editor.getDataAsNumpy()[0, 0] == 1
+
+        editor.handler.setCellValue(0, 0, 9)
+        assert editor.getDataAsNumpy()[0, 0] == 9
+
+        editor.handler.addRow({"X": 5, "Y": 6})
+        assert editor.getDataAsNumpy().shape == (3, 2)
+
+        # Silent edits invalidate the cache too
+        editor.handler.setRowData(2, {"X": 7}, shouldEmit=False)
+        assert editor.getDataAsNumpy()[2, 0] == 7
+
+        editor.handler.updateValuesFromSaved([{"name": 3, "value": 8}], shouldEmit=False)
+        assert editor.getDataAsNumpy()[1, 1] == 8
+
+    def test_export_as_structured_numpy(self, qt_app):
+        """Test exporting data as a structured array typed per column"""
+        headers = ["Name", "Age", "Score", "Active"]
+        data = [
+            {"Name": "Alice", "Age": 28, "Score": 1.5, "Active": True},
+            {"Name": "Bob", "Age": 35, "Score": 2, "Active": False},
+        ]
+
+        editor = createTableEditor(headers=headers, data=data, column_types={"Active": "checkbox"})
+        exported = editor.getDataAsStructuredNumpy()
+
+        assert exported.shape == (2,)
+        assert exported.dtype == np.dtype(
+            [("Name", "U5"), ("Age", "i8"), ("Score", "f8"), ("Active", "?")]
+        )
+        assert exported["Age"].tolist() == [28, 35]
+        assert exported["Active"].tolist() == [True, False]
+        exported["Age"][0] = 0
+        assert editor.getDataAsStructuredNumpy()["Age"].tolist() == [28, 35]
+
     def test_invalid_headers(self, qt_app):
         """Test that invalid headers raise error"""
         with pytest.raises(ValueError):
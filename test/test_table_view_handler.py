@@ -10,8 +10,9 @@ This demonstrates how to use the TableViewHandler with different cell types:
 import sys
 
 import numpy as np
+from _qt_fixture import app
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QApplication,
     QHBoxLayout,
     QLabel,
     QPushButton,
@@ -169,8 +170,6 @@ class TestTableViewWindow(QWidget):
 
 def testBasicOperations():
     """Test basic handler operations without GUI."""
-    app = QApplication.instance() or QApplication(sys.argv)
-
     tableView = QTableView()
     handler = TableViewHandler(tableView, ["A", "B", "C"])
     handler.setupColumns([("a", "text"), ("b", "text"), ("c", "text")])
@@ -201,13 +200,9 @@ def testBasicOperations():
     handler.clearAll()
     assert handler.model.rowCount() == 0, "Row count should be 0"
 
-    print("✅ All basic operation tests passed!")
-
 
 def testNumpyOperations():
     """Test NumPy helper operations."""
-    app = QApplication.instance() or QApplication(sys.argv)
-
     tableView = QTableView()
     handler = TableViewHandler(tableView, ["X", "Y", "Z"])
     handler.setupColumns([("x", "text"), ("y", "text"), ("z", "text")])
@@ -241,13 +236,9 @@ def testNumpyOperations():
     assert handler.model.rowCount() == 2, "Should have 2 rows after loading"
     assert handler.getCellValue(0, 0) == 10, "First cell should be 10"
 
-    print("✅ All NumPy operation tests passed!")
-
 
 def testColumnTypes():
     """Test different column types."""
-    app = QApplication.instance() or QApplication(sys.argv)
-
     tableView = QTableView()
     handler = TableViewHandler(tableView, ["Name", "Type", "Active"])
     handler.setupColumns(
@@ -278,7 +269,220 @@ def testColumnTypes():
     assert data[0]["active"] == True, "First checkbox should be True"
     assert data[1]["active"] == False, "Second checkbox should be False"
 
-    print("✅ All column type tests passed!")
+
+def testLoadDataSignals():
+    """Test that loadData notifies listeners once for the whole load."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A", "B"])
+    handler.setupColumns([("a", "text"), ("b", "text")])
+    handler.addRow({"a": "old", "b": "old"})
+
+    dataEvents = []
+    rowCounts = []
+    handler.onDataChanged(dataEvents.append)
+    handler.onRowCountChanged(rowCounts.append)
+
+    handler.loadData([{"a": str(i), "b": str(i * 2)} for i in range(50)])
+
+    assert handler.model.rowCount() == 50, "Should have 50 rows"
+    assert handler.getCellValue(49, 1) == "98", "Last cell should be '98'"
+    assert len(dataEvents) == 1, f"Expected one dataChanged, got {len(dataEvents)}"
+    assert len(dataEvents[0]) == 50, "dataChanged should carry the loaded rows"
+    assert rowCounts == [50], f"Expected rowCountChanged(50), got {rowCounts}"
+
+    # shouldEmit=False stays silent
+    handler.loadData([{"a": "x", "b": "y"}], shouldEmit=False)
+    assert len(dataEvents) == 1 and rowCounts == [50], "Silent load should not emit"
+
+
+def testDisplayCache():
+    """Test that cached data() results follow edits to the model."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A", "B"])
+    handler.setupColumns([("a", "text"), ("b", "checkbox")])
+    handler.loadData([{"a": "1", "b": True}])
+
+    model = handler.model
+    index = model.index(0, 0)
+    assert model.data(index, Qt.DisplayRole) == "1", "Cell (0,0) should be '1'"
+
+    handler.setCellValue(0, 0, "2")
+    assert model.data(index, Qt.DisplayRole) == "2", "setData should refresh the cell"
+
+    handler.setRowData(0, {"a": "3"}, shouldEmit=False)
+    assert model.data(index, Qt.DisplayRole) == "3", "setRowData should refresh the cell"
+
+    checkIndex = model.index(0, 1)
+    assert model.data(checkIndex, Qt.DisplayRole) == "", "Unlabelled checkbox shows no text"
+    handler.setCellType(0, 1, "checkbox", checkboxLabels=("Yes", "No"))
+    assert model.data(checkIndex, Qt.DisplayRole) == "Yes", "setCellType should refresh the cell"
+
+    handler.addRow({"a": "4", "b": False})
+    handler.deleteRow(0)
+    assert model.data(index, Qt.DisplayRole) == "4", "deleteRow should shift cached cells"
+
+    model.data(index, Qt.FontRole)
+    model.data(index, Qt.UserRole)
+    assert {key[2] for key in model._displayCache} <= {Qt.DisplayRole, Qt.CheckStateRole}, (
+        "Only display/edit/check-state results should be cached"
+    )
+
+
+def testDeleteRows():
+    """Test removing a block of rows and its per-cell configuration."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A"])
+    handler.setupColumns([("a", "text")])
+    handler.loadData([{"a": str(i)} for i in range(6)])
+    handler.setCellType(4, 0, "checkbox", checkboxLabels=("Yes", "No"))
+
+    handler.model.deleteRows(2, 3)
+
+    assert [row["a"] for row in handler.getData()] == ["0", "1", "5"], "Rows 2-4 should be gone"
+    assert (4, 0) not in handler.model.cellTypeOverrides, "Deleted cell config should be dropped"
+
+    # Out-of-range blocks are ignored
+    handler.model.deleteRows(2, 5)
+    assert handler.model.rowCount() == 3, "Row count should still be 3"
+
+
+def testSetDataBlock():
+    """Test writing a block of cells with a single change notification."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A", "B", "C"])
+    handler.setupColumns([("a", "text"), ("b", "text"), ("c", "text")])
+    handler.loadData([{"a": "", "b": "", "c": ""} for _ in range(3)])
+
+    ranges = []
+    handler.model.dataChanged.connect(
+        lambda topLeft, bottomRight, roles=None: ranges.append(
+            (topLeft.row(), topLeft.column(), bottomRight.row(), bottomRight.column())
+        )
+    )
+
+    # The block overhangs the last row and column; the overhang is dropped
+    assert handler.model.setDataBlock(1, 1, [["1", "2", "x"], ["3", "4"], ["y"]])
+
+    assert ranges == [(1, 1, 2, 2)], f"Expected one block notification, got {ranges}"
+    assert [handler.getCellValue(r, c) for r in (1, 2) for c in (1, 2)] == ["1", "2", "3", "4"]
+    assert not handler.model.setDataBlock(5, 0, [["z"]]), "Out-of-range block should be ignored"
+
+
+def testAddRows():
+    """Test appending several rows with a single insertion."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A"])
+    handler.setupColumns([("a", "text")])
+    handler.addRow({"a": "0"})
+
+    inserted = []
+    handler.model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    handler.addRows([{"a": "1"}, {"a": "2"}, {"a": "3"}])
+
+    assert inserted == [(1, 3)], f"Expected one insertion of rows 1-3, got {inserted}"
+    assert [row["a"] for row in handler.getData()] == ["0", "1", "2", "3"]
+
+    # An empty batch is a no-op
+    handler.addRows([])
+    assert len(inserted) == 1, "Empty batch should not insert"
+
+
+def testLoadFromYamlConfigSignals():
+    """Test that loadFromYamlConfig resets the model once instead of inserting per row."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["Parameter", "Value"])
+    handler.setupColumns([("name", "text"), ("value", "text")])
+
+    resets = []
+    inserted = []
+    dataEvents = []
+    handler.model.modelReset.connect(lambda: resets.append(True))
+    handler.model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    handler.onDataChanged(dataEvents.append)
+
+    handler.loadFromYamlConfig(
+        [
+            {"name": "MAXITT", "type": "editable", "defaultValueIndex": 35},
+            {
+                "name": "IDIAG",
+                "type": "combobox",
+                "defaultValueIndex": 1,
+                "items": [{0: "Area"}, {1: "Diagonal"}],
+            },
+            {"name": "ENABLED", "type": "checkbox", "checkedLabel": "On", "uncheckedLabel": "Off"},
+        ]
+    )
+
+    assert len(resets) == 1 and not inserted, f"Expected one reset, got {resets}/{inserted}"
+    assert len(dataEvents) == 1, f"Expected one dataChanged, got {len(dataEvents)}"
+    assert handler.getCellValue(1, 1) == "Diagonal", "Combobox should show its default item"
+    assert handler.model.getKeyValue(1, 1) == 1, "Combobox should store the default key"
+    assert handler.model.getCellType(2, 1) == "checkbox", "Row 2 should be a checkbox cell"
+    assert handler.model.cellCheckboxLabels[(2, 1)] == ("On", "Off")
+
+
+def testComboItemsColumnFallback():
+    """Test that cells without their own combo items use their column's items."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A", "B"])
+    handler.setupColumns([("a", "text"), ("b", "combobox")])
+    handler.model.columnComboItems[1] = ["Low", "High"]
+    handler.loadData([{"a": "1", "b": "Low"}, {"a": "2", "b": "High"}])
+
+    model = handler.model
+    assert model.getComboItems(1, 1) == ["Low", "High"], "Row 1 should use the column items"
+    assert (1, 1) not in model.cellComboItems, "Column items should not be copied per cell"
+
+    handler.setCellType(0, 1, "combobox", ["Off", "On"])
+    assert model.getComboItems(0, 1) == ["Off", "On"], "Per-cell items should win"
+    assert model.getComboItems(0, 0) == [], "Columns without items should have none"
+
+
+def testUpdateValuesFromSavedSilent():
+    """Test that a silent updateValuesFromSaved still refreshes cached cells."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["Parameter", "Value"])
+    handler.setupColumns([("name", "text"), ("value", "text")])
+    handler.loadFromYamlConfig([{"name": "IRAD", "type": "editable", "defaultValueIndex": "5"}])
+
+    model = handler.model
+    index = model.index(0, 1)
+    assert model.data(index, Qt.DisplayRole) == "5", "Cell (0,1) should show the default"
+
+    handler.updateValuesFromSaved([{"name": "IRAD", "value": "42"}], shouldEmit=False)
+    assert model.data(index, Qt.DisplayRole) == "42", "Saved value should replace cached text"
+
+
+def testNonStringCellType():
+    """Test that a missing (None) cell type is stored rather than rejected."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A", "B"])
+    handler.setupColumns([("a", "text"), ("b", None)])
+    handler.setColumnType(0, None)
+    handler.setCellType(0, 1, None)
+    handler.loadData([{"a": "1", "b": "2"}])
+
+    model = handler.model
+    assert model.getCellType(0, 1) is None, "None cell type should be stored as-is"
+    assert model.data(model.index(0, 0), Qt.DisplayRole) == "1", "None type shows as text"
+
+
+def testCellTypeBeforeFirstLoad():
+    """Test that cell config set on an empty table survives the first loadData."""
+    tableView = QTableView()
+    handler = TableViewHandler(tableView, ["A", "B"])
+    handler.setupColumns([("a", "text"), ("b", "text")])
+    handler.setCellType(0, 1, "checkbox", checkboxLabels=("Yes", "No"))
+
+    handler.loadData([{"a": "1", "b": True}])
+
+    model = handler.model
+    assert model.getCellType(0, 1) == "checkbox", "Cell type set before loading should survive"
+    assert model.data(model.index(0, 1), Qt.DisplayRole) == "Yes", "Labels should survive too"
+
+    handler.loadData([{"a": "2", "b": True}])
+    assert model.getCellType(0, 1) == "text", "Reloading a filled table resets cell config"
 
 
 def runAllTests():
@@ -290,6 +494,16 @@ def runAllTests():
     testBasicOperations()
     testNumpyOperations()
     testColumnTypes()
+    testLoadDataSignals()
+    testDisplayCache()
+    testDeleteRows()
+    testSetDataBlock()
+    testAddRows()
+    testLoadFromYamlConfigSignals()
+    testComboItemsColumnFallback()
+    testUpdateValuesFromSavedSilent()
+    testNonStringCellType()
+    testCellTypeBeforeFirstLoad()
 
     print("\n" + "=" * 50)
     print("All tests completed successfully! ✅")
@@ -306,7 +520,6 @@ if __name__ == "__main__":
 
     # Then show interactive demo
     print("Starting interactive demo...")
-    app = QApplication.instance() or QApplication(sys.argv)
     window = TestTableViewWindow()
     window.show()
     sys.exit(app.exec())
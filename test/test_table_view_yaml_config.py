@@ -3,17 +3,32 @@ Test TableViewHandler with YAML config loading.
 
 This demonstrates per-cell type support where different rows in the same column
 can have different cell types (editable text vs combobox).
+
+YAML is parsed with PyYAML's libyaml-backed CSafeLoader. If PyYAML was built without
+libyaml (install the libyaml headers, e.g. libyaml-dev, before installing PyYAML), the
+module warns and falls back to the pure-Python SafeLoader.
 """
 
 import os
 import sys
 import unittest
+import warnings
 
 import yaml
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QLabel, QPushButton, QTableView, QVBoxLayout, QWidget
+from _qt_fixture import app
+from PySide6.QtWidgets import QTableView, QWidget
+
+from nays.ui.handler.table_view_handler import TableViewHandler
+
+# Set NAYS_TEST_VERBOSE=1 for the runAllTests banner and per-test runner output
+_VERBOSE = os.environ.get("NAYS_TEST_VERBOSE") == "1"
 
-from nays.ui.handler.table_view_handler import MultiTypeCellDelegate, TableViewHandler
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    warnings.warn("PyYAML was built without libyaml; YAML parsing in these tests will be slower")
+    from yaml import SafeLoader as Loader
 
 # ---------------------------------
 # Sample YAML Config (same as config.yml)
@@ -93,37 +108,65 @@ hydrodynamic:
       ]
 """
 
+# Column layout shared by every handler built from the sample configs
+_HEADERS = ("Parameter", "Value", "Description")
+_COLSPEC = (
+    ("name", "text"),
+    ("value", "text"),  # Will be overridden per-cell
+    ("description", "text"),
+)
+
+
+def _loadYamlFile(path: str):
+    """Parse a YAML file."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=Loader)
+
 
 class TestYamlConfigLoading(unittest.TestCase):
     """Unit tests for YAML config loading functionality."""
 
     @classmethod
     def setUpClass(cls):
-        """Ensure QApplication exists."""
-        cls.app = QApplication.instance() or QApplication(sys.argv)
+        """Build the view and handler shared by all tests and parse the sample configs once."""
+        cls._tableView = QTableView()
+        # loadFromYamlConfig only reads the config, so every test shares these parsed lists
+        cls._generalConfig = yaml.load(SAMPLE_CONFIG, Loader=Loader)["hydrodynamics"][
+            "generalConfig"
+        ]
+        cls._radiationConfig = yaml.load(SAMPLE_CONFIG_WITH_NEGATIVE_KEYS, Loader=Loader)[
+            "hydrodynamic"
+        ]["radiationOperation"]
+        # The handler appends/pops headers in place, so it gets its own list
+        cls._handler = TableViewHandler(cls._tableView, list(_HEADERS))
+        cls._handler.setupColumns(_COLSPEC)
+        cls._realConfigPath = os.path.join(
+            os.path.dirname(__file__), "..", "nays", "ui", "handler", "config.yml"
+        )
+
+    def setUp(self):
+        """Detach the previous test's model and column delegates from the shared view."""
+        tableView = self._tableView
+        model = tableView.model()
+        if model is not None:
+            for col in range(model.columnCount()):
+                tableView.setItemDelegateForColumn(col, None)
+        tableView.setModel(None)
+
+    def _makeHandler(self, config, mode="value"):
+        """Reattach the shared handler's model and load config into its value column."""
+        handler = self._handler
+        # loadFromYamlConfig clears the previous rows and per-cell config itself
+        self._tableView.setModel(handler.model)
+        handler.loadFromYamlConfig(config, valueColumn=1, comboDisplayMode=mode)
+        return handler
 
     def testLoadFromYamlConfig(self):
         """Test loading table data from YAML config format."""
-        # Parse YAML
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
-
-        # Create table handler
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        # Setup columns
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),  # Will be overridden per-cell
-                ("description", "text"),
-            ]
-        )
+        generalConfig = self._generalConfig
 
         # Load from YAML config
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1)
+        handler = self._makeHandler(generalConfig)
 
         # Verify row count
         self.assertEqual(handler.model.rowCount(), 6, "Should have 6 rows")
@@ -143,28 +186,11 @@ class TestYamlConfigLoading(unittest.TestCase):
         self.assertEqual(data[2]["name"], "IFORCE")
         self.assertEqual(data[2]["value"], "Do executed FORCE")
 
-        print("✅ loadFromYamlConfig test passed!")
-
     def testPerCellTypes(self):
         """Test that per-cell types are correctly set."""
-        # Parse YAML
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
+        generalConfig = self._generalConfig
 
-        # Create table handler
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1)
+        handler = self._makeHandler(generalConfig)
 
         # Verify cell types
         # Row 0 (USERID_PATH): should be text
@@ -179,63 +205,35 @@ class TestYamlConfigLoading(unittest.TestCase):
         # Row 4 (MAXITT): should be text
         self.assertEqual(handler.model.getCellType(4, 1), "text")
 
-        print("✅ Per-cell types test passed!")
-
     def testComboItemsStoredCorrectly(self):
         """Test that combo items are correctly stored for each cell."""
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
-
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
+        generalConfig = self._generalConfig
 
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
+        handler = self._makeHandler(generalConfig)
 
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1)
+        comboDict = handler.model.cellComboItems
 
         # Check combo items for IDIAG (row 1)
-        comboItems = handler.model.cellComboItems.get((1, 1), [])
+        comboItems = comboDict.get((1, 1), ())
         self.assertEqual(len(comboItems), 2)
-        self.assertIn("Square root of panel's area", comboItems)
-        self.assertIn("Panel's maximum diagonal", comboItems)
+        self.assertSetEqual(
+            set(comboItems), {"Square root of panel's area", "Panel's maximum diagonal"}
+        )
 
         # Check combo items for IFORCE (row 2)
-        comboItems = handler.model.cellComboItems.get((2, 1), [])
+        comboItems = comboDict.get((2, 1), ())
         self.assertEqual(len(comboItems), 2)
-        self.assertIn("Do not executed FORCE", comboItems)
-        self.assertIn("Do executed FORCE", comboItems)
+        self.assertSetEqual(set(comboItems), {"Do not executed FORCE", "Do executed FORCE"})
 
         # Check editable row has no combo items
-        comboItems = handler.model.cellComboItems.get((0, 1), [])
+        comboItems = comboDict.get((0, 1), ())
         self.assertEqual(len(comboItems), 0)
 
-        print("✅ Combo items storage test passed!")
-
     def testGetConfigValuesReturnsKeys(self):
         """Test extracting config values returns keys for combobox cells."""
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
+        generalConfig = self._generalConfig
 
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1)
+        handler = self._makeHandler(generalConfig)
 
         # Get config values with returnKeys=True (default)
         values = handler.getConfigValues()
@@ -253,26 +251,11 @@ class TestYamlConfigLoading(unittest.TestCase):
         # IPOTEN: defaultValueIndex=1, items[1] = {1: "..."}, so key = 1
         self.assertEqual(values["IPOTEN"], 1)
 
-        print("✅ getConfigValues returns keys test passed!")
-
     def testGetConfigValuesReturnsDisplayText(self):
         """Test extracting config values can return display text."""
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
+        generalConfig = self._generalConfig
 
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1)
+        handler = self._makeHandler(generalConfig)
 
         # Get config values with returnKeys=False
         values = handler.getConfigValues(returnKeys=False)
@@ -281,28 +264,13 @@ class TestYamlConfigLoading(unittest.TestCase):
         self.assertEqual(values["IDIAG"], "Square root of panel's area")
         self.assertEqual(values["IFORCE"], "Do executed FORCE")
 
-        print("✅ getConfigValues returns display text test passed!")
-
     def testNegativeKeyValues(self):
         """Test that negative key values are properly handled."""
-        config = yaml.safe_load(SAMPLE_CONFIG_WITH_NEGATIVE_KEYS)
-        radiationConfig = config["hydrodynamic"]["radiationOperation"]
-
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
+        radiationConfig = self._radiationConfig
 
-        handler.loadFromYamlConfig(radiationConfig, valueColumn=1)
+        handler = self._makeHandler(radiationConfig)
 
-        # Get config values
+        # Snapshot config values once for all assertions
         values = handler.getConfigValues()
 
         # IRAD(i): defaultValueIndex=2, items[2] = {1: "..."}, so key = 1
@@ -312,11 +280,8 @@ class TestYamlConfigLoading(unittest.TestCase):
         self.assertEqual(values["IDIFF(i)"], 1)
 
         # Verify display shows correct text
-        data = handler.getData()
-        self.assertEqual(data[0]["value"], "Solve for the radiation velocity potentials")
-        self.assertEqual(data[1]["value"], "Solve for all diffraction components")
-
-        print("✅ Negative key values test passed!")
+        self.assertEqual(handler.getCellValue(0, 1), "Solve for the radiation velocity potentials")
+        self.assertEqual(handler.getCellValue(1, 1), "Solve for all diffraction components")
 
     def testDefaultValueIndexAsListIndex(self):
         """Test that defaultValueIndex is treated as index into items list."""
@@ -335,43 +300,44 @@ class TestYamlConfigLoading(unittest.TestCase):
             }
         ]
 
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
+        handler = self._makeHandler(testConfig)
 
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        handler.loadFromYamlConfig(testConfig, valueColumn=1)
-
-        # Get config values - should return key 20 (not index 1)
+        # Config values should return key 20 (not index 1)
         values = handler.getConfigValues()
         self.assertEqual(values["TEST_PARAM"], 20)
 
         # Display should show the text for key 20
-        data = handler.getData()
-        self.assertEqual(data[0]["value"], "Second item (key=20)")
+        self.assertEqual(handler.getCellValue(0, 1), "Second item (key=20)")
+
+    def testSharedItemsAlias(self):
+        """Test that rows sharing one items list through a YAML alias each get its items."""
+        config = yaml.load(
+            """
+            - name: IRAD(1)
+              type: 'combobox'
+              defaultValueIndex: 0
+              items: &modes [{-1: "Skip"}, {0: "Partial"}, {1: "Full"}]
+            - name: IRAD(2)
+              type: 'combobox'
+              defaultValueIndex: 2
+              items: *modes
+            """,
+            Loader=Loader,
+        )
+
+        handler = self._makeHandler(config)
 
-        print("✅ defaultValueIndex as list index test passed!")
+        self.assertEqual(handler.getConfigValues(), {"IRAD(1)": -1, "IRAD(2)": 1})
+        self.assertEqual(handler.getCellValue(1, 1), "Full")
+        self.assertEqual(handler.model.cellComboItems[(0, 1)], ["Skip", "Partial", "Full"])
+        self.assertEqual(handler.model.cellComboItems[(1, 1)], ["Skip", "Partial", "Full"])
 
     def testLoadRealYamlFile(self):
         """Test loading from actual config.yml file."""
-        # Get the path to config.yml
-        configPath = os.path.join(
-            os.path.dirname(__file__), "..", "nays", "ui", "handler", "config.yml"
-        )
-
-        if not os.path.exists(configPath):
+        # Checked before any read so a missing file skips without touching the parser
+        if not os.path.exists(self._realConfigPath):
             self.skipTest("config.yml not found")
-
-        # Load YAML file
-        with open(configPath, "r") as f:
-            config = yaml.safe_load(f)
+        config = _loadYamlFile(self._realConfigPath)
 
         # The real config.yml has 'hydrodynamic.radiationOperation' structure
         if "hydrodynamic" in config:
@@ -381,20 +347,7 @@ class TestYamlConfigLoading(unittest.TestCase):
         else:
             self.skipTest("Unknown config structure")
 
-        # Create table handler
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        handler.loadFromYamlConfig(radiationConfig, valueColumn=1)
+        handler = self._makeHandler(radiationConfig)
 
         # Verify all rows loaded
         self.assertGreater(handler.model.rowCount(), 0, "Should have rows")
@@ -403,11 +356,9 @@ class TestYamlConfigLoading(unittest.TestCase):
         values = handler.getConfigValues()
         self.assertGreater(len(values), 0, "Should have values")
 
-        print("✅ Real YAML file loading test passed!")
-
     def testMultiTypeCellDelegate(self):
         """Test the MultiTypeCellDelegate is correctly applied."""
-        tableView = QTableView()
+        tableView = self._tableView
         headers = ["Parameter", "Value"]
         handler = TableViewHandler(tableView, headers)
 
@@ -422,14 +373,14 @@ class TestYamlConfigLoading(unittest.TestCase):
         handler.enableMultiTypeCells()
 
         # Verify delegate is set
+        from nays.ui.handler.table_view_handler import MultiTypeCellDelegate
+
         self.assertIsNotNone(handler._multiTypeDelegate)
         self.assertIsInstance(handler._multiTypeDelegate, MultiTypeCellDelegate)
 
-        print("✅ MultiTypeCellDelegate test passed!")
-
     def testMixedCellTypesInSameColumn(self):
         """Test setting different cell types manually in the same column."""
-        tableView = QTableView()
+        tableView = self._tableView
         headers = ["Name", "Value"]
         handler = TableViewHandler(tableView, headers)
 
@@ -444,9 +395,13 @@ class TestYamlConfigLoading(unittest.TestCase):
         handler.enableMultiTypeCells()
 
         # Add rows
-        handler.addRow({"name": "Text Field", "value": "Hello"})
-        handler.addRow({"name": "Combo Field", "value": "Option A"})
-        handler.addRow({"name": "Another Text", "value": "World"})
+        handler.addRows(
+            [
+                {"name": "Text Field", "value": "Hello"},
+                {"name": "Combo Field", "value": "Option A"},
+                {"name": "Another Text", "value": "World"},
+            ]
+        )
 
         # Set different types for cells in column 1
         handler.setCellType(0, 1, "text")
@@ -463,103 +418,38 @@ class TestYamlConfigLoading(unittest.TestCase):
             handler.model.cellComboItems.get((1, 1)), ["Option A", "Option B", "Option C"]
         )
 
-        print("✅ Mixed cell types test passed!")
-
-    def testComboDisplayModeValue(self):
-        """Test comboDisplayMode='value' shows text values."""
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
-
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        # Load with value mode (default)
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1, comboDisplayMode="value")
-
-        # Check displayed value shows the text
-        data = handler.getData()
-        self.assertEqual(data[1]["value"], "Square root of panel's area")
-        self.assertEqual(data[2]["value"], "Do executed FORCE")
-
-        # Check combo items show values
-        comboItems = handler.model.cellComboItems.get((1, 1), [])
-        self.assertIn("Square root of panel's area", comboItems)
-        self.assertIn("Panel's maximum diagonal", comboItems)
-
-        print("✅ comboDisplayMode='value' test passed!")
-
-    def testComboDisplayModeKey(self):
-        """Test comboDisplayMode='key' shows index keys."""
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
-
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        # Load with key mode
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1, comboDisplayMode="key")
-
-        # Check displayed value shows the key/index
-        data = handler.getData()
-        self.assertEqual(data[1]["value"], "0")  # IDIAG defaultValueIndex=0
-        self.assertEqual(data[2]["value"], "1")  # IFORCE defaultValueIndex=1
-
-        # Check combo items show keys
-        comboItems = handler.model.cellComboItems.get((1, 1), [])
-        self.assertIn("0", comboItems)
-        self.assertIn("1", comboItems)
-
-        print("✅ comboDisplayMode='key' test passed!")
-
-    def testComboDisplayModeBoth(self):
-        """Test comboDisplayMode='both' shows 'key: value' format."""
-        config = yaml.safe_load(SAMPLE_CONFIG)
-        generalConfig = config["hydrodynamics"]["generalConfig"]
-
-        tableView = QTableView()
-        headers = ["Parameter", "Value", "Description"]
-        handler = TableViewHandler(tableView, headers)
-
-        handler.setupColumns(
-            [
-                ("name", "text"),
-                ("value", "text"),
-                ("description", "text"),
-            ]
-        )
-
-        # Load with both mode
-        handler.loadFromYamlConfig(generalConfig, valueColumn=1, comboDisplayMode="both")
+    def testComboDisplayModes(self):
+        """Test comboDisplayMode 'value', 'key' and 'both' over the same config."""
+        generalConfig = self._generalConfig
+
+        # mode -> (displayed IDIAG/IFORCE values, IDIAG combo items)
+        cases = [
+            (
+                "value",
+                ["Square root of panel's area", "Do executed FORCE"],
+                ["Square root of panel's area", "Panel's maximum diagonal"],
+            ),
+            # IDIAG defaultValueIndex=0, IFORCE defaultValueIndex=1
+            ("key", ["0", "1"], ["0", "1"]),
+            (
+                "both",
+                ["0: Square root of panel's area", "1: Do executed FORCE"],
+                ["0: Square root of panel's area", "1: Panel's maximum diagonal"],
+            ),
+        ]
 
-        # Check displayed value shows "key: value" format
-        data = handler.getData()
-        self.assertEqual(data[1]["value"], "0: Square root of panel's area")
-        self.assertEqual(data[2]["value"], "1: Do executed FORCE")
+        for mode, expectedValues, expectedItems in cases:
+            with self.subTest(mode=mode):
+                handler = self._makeHandler(generalConfig, mode=mode)
 
-        # Check combo items show "key: value" format
-        comboItems = handler.model.cellComboItems.get((1, 1), [])
-        self.assertIn("0: Square root of panel's area", comboItems)
-        self.assertIn("1: Panel's maximum diagonal", comboItems)
+                # Check displayed values
+                self.assertEqual(handler.getCellValue(1, 1), expectedValues[0])
+                self.assertEqual(handler.getCellValue(2, 1), expectedValues[1])
 
-        print("✅ comboDisplayMode='both' test passed!")
+                # Check combo items
+                self.assertSetEqual(
+                    set(handler.model.cellComboItems.get((1, 1), ())), set(expectedItems)
+                )
 
 
 # ---------------------------------
@@ -580,6 +470,8 @@ class YamlConfigDemoWindow(QWidget):
 
     def setupUi(self):
         """Setup UI components."""
+        from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
+
         layout = QVBoxLayout(self)
 
         # Info label
@@ -605,8 +497,7 @@ class YamlConfigDemoWindow(QWidget):
 
     def loadConfig(self):
         """Load config from YAML."""
-        # Parse embedded YAML
-        config = yaml.safe_load(SAMPLE_CONFIG)
+        config = yaml.load(SAMPLE_CONFIG, Loader=Loader)
         generalConfig = config["hydrodynamics"]["generalConfig"]
 
         # Setup handler
@@ -648,16 +539,24 @@ class YamlConfigDemoWindow(QWidget):
 
 def runAllTests():
     """Run all unit tests."""
-    print("\n" + "=" * 60)
-    print("Running TableViewHandler YAML Config Tests")
-    print("=" * 60 + "\n")
-
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestYamlConfigLoading)
+    if _VERBOSE:
+        print("\n" + "=" * 60)
+        print("Running TableViewHandler YAML Config Tests")
+        print("=" * 60 + "\n")
+
+    # Reflect over the test case once; a run suite drops its tests, so rebuild it from the names.
+    # Definition order (TestLoader sorts alphabetically) keeps the tests that load the shared
+    # sample config on the shared handler next to each other, as pytest runs them.
+    if not hasattr(runAllTests, "_testNames"):
+        runAllTests._testNames = [
+            name
+            for name, attr in vars(TestYamlConfigLoading).items()
+            if name.startswith("test") and callable(attr)
+        ]
+    suite = unittest.TestSuite(map(TestYamlConfigLoading, runAllTests._testNames))
 
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    runner = unittest.TextTestRunner(verbosity=2 if _VERBOSE else 1)
     result = runner.run(suite)
 
     return result.wasSuccessful()
@@ -670,7 +569,6 @@ if __name__ == "__main__":
     if success and "--demo" in sys.argv:
         # Show interactive demo
         print("\nStarting interactive demo...")
-        app = QApplication.instance() or QApplication(sys.argv)
         window = YamlConfigDemoWindow()
         window.show()
         sys.exit(app.exec())
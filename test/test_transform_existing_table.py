@@ -9,27 +9,24 @@ interference.
 import sys
 from typing import Any, Dict, List
 
-from PySide6.QtWidgets import QApplication, QTableView
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QTableView
 
 from nays.ui.handler import createTableEditorEmbedded
 
 
-def test_transform_existing_table_view():
+def test_transform_existing_table_view(qapp):
     """Test creating an independent editor for existing table data."""
 
     print("\n" + "=" * 70)
     print("TEST: Create Independent Table Editor")
     print("=" * 70)
 
-    app = QApplication.instance() or QApplication([])
-
     # Create an existing table view (as if from UI file)
     # self.tableLineElementDefinition = QTableView(parent)
     existing_table = QTableView()
-    existing_table.setObjectName("tableLineElementDefinition")
 
     print("\n✓ Created existing table view")
-    print(f"  - Object: {existing_table.objectName()}")
     print(f"  - Parent: {existing_table.parent()}")
 
     # Prepare data
@@ -85,7 +82,8 @@ def test_transform_existing_table_view():
     )  # Still in original parent or orphaned
     print("  ✓ Original table view is unaffected by editor creation")
 
-    # Show the editor so widgets become visible
+    # Show the editor so widgets become visible, without mapping a window on screen
+    editor.setAttribute(Qt.WA_DontShowOnScreen, True)
     editor.show()
 
     assert editor.tableView.isVisible(), "Editor's table view should be visible"
@@ -132,4 +130,6 @@ def test_transform_existing_table_view():
 
 
 if __name__ == "__main__":
-    test_transform_existing_table_view()
+    from _qt_fixture import app
+
+    test_transform_existing_table_view(app)
@@ -2,7 +2,7 @@
 mvvm_treeview.py
 ================
 PySide6 MVVM QTreeView with:
-  • Simulated async DB load (QTimer, 600 ms delay)
+  • Simulated async DB load (QThreadPool worker, 650 ms delay)
   • Two-level tree: Category (parent) → Item (child)
   • Different context menus for parent vs child nodes
   • Per-node icons drawn with QPainter (no external files needed)
@@ -16,9 +16,9 @@ Run:      python mvvm_treeview.py
 
 from __future__ import annotations
 
+import math
 import sys
 import time
-from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any
 
@@ -29,6 +29,7 @@ from PySide6.QtCore import (
     QModelIndex,
     QObject,
     QPersistentModelIndex,
+    QPoint,
     QRunnable,
     QSize,
     Qt,
@@ -36,6 +37,7 @@ from PySide6.QtCore import (
     QThreadPool,
     QTimer,
     Signal,
+    Slot,
 )
 from PySide6.QtGui import (
     QAction,
@@ -84,21 +86,53 @@ class NodeKind(Enum):
     ITEM = auto()  # child-level
 
 
-@dataclass
 class TreeNode:
     """One node in the tree. Children only allowed on CATEGORY nodes."""
 
-    id: int
-    kind: NodeKind
-    name: str
-    description: str = ""
-    status: str = "active"  # active | warning | error | disabled
-    tags: list[str] = field(default_factory=list)
-    children: list["TreeNode"] = field(default_factory=list)
-    parent: "TreeNode | None" = field(default=None, repr=False, compare=False)
-
-    # runtime state
-    is_loading: bool = False
+    # data() reads these on every paint; slots skip the per-instance __dict__
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "description",
+        "status",
+        "tags",
+        "children",
+        "parent",
+        "is_loading",
+        "row",
+        "store_index",
+        "_cached_icon",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        kind: NodeKind,
+        name: str,
+        description: str = "",
+        status: str = "active",  # active | warning | error | disabled
+        tags: list[str] | None = None,
+        children: list[TreeNode] | None = None,
+        parent: TreeNode | None = None,
+    ):
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.description = description
+        self.status = status
+        self.tags = [] if tags is None else tags
+        self.children = [] if children is None else children
+        self.parent = parent
+
+        # runtime state
+        self.is_loading = False
+        # position among the parent's children (or the VM roots); kept by TreeViewModel
+        self.row = 0
+        # position in the TreeViewModel display columns (names / statuses / tags_joined / tooltips)
+        self.store_index = -1
+        # status icon memoized by TreeItemModel; cleared by TreeViewModel.update_node
+        self._cached_icon: QIcon | None = None
 
     def child_count(self) -> int:
         return len(self.children)
@@ -109,9 +143,7 @@ class TreeNode:
         return None
 
     def row_in_parent(self) -> int:
-        if self.parent:
-            return self.parent.children.index(self)
-        return 0
+        return self.row
 
 
 # ═══════════════════════════════════════════════════════════
@@ -122,14 +154,41 @@ class TreeNode:
 class IconFactory:
     """Creates QIcon objects painted on-the-fly — no image files needed."""
 
-    _cache: dict[str, QIcon] = {}
+    _cache: dict[tuple[str, int], QIcon] = {}
+
+    # Icons with a drawer; each is drawn by the staticmethod named "_" + name
+    NAMES = (
+        "folder",
+        "folder_open",
+        "item",
+        "item_warning",
+        "item_error",
+        "item_disabled",
+        "loading",
+        "add",
+        "delete",
+        "edit",
+        "refresh",
+        "expand",
+        "collapse",
+        "info",
+        "properties",
+    )
 
     @classmethod
     def get(cls, name: str, size: int = 16) -> QIcon:
-        key = f"{name}@{size}"
-        if key not in cls._cache:
-            cls._cache[key] = cls._make(name, size)
-        return cls._cache[key]
+        key = (name, size)
+        icon = cls._cache.get(key)
+        if icon is None:
+            icon = cls._cache[key] = cls._make(name, size)
+        return icon
+
+    @classmethod
+    def warmup(cls, sizes: tuple[int, ...] = (16, 24, 32)):
+        """Paint every icon at the given sizes up front; needs a QApplication."""
+        for size in sizes:
+            for name in cls.NAMES:
+                cls.get(name, size)
 
     @classmethod
     def _make(cls, name: str, size: int) -> QIcon:
@@ -137,24 +196,7 @@ class IconFactory:
         px.fill(Qt.transparent)
         p = QPainter(px)
         p.setRenderHint(QPainter.Antialiasing)
-        dispatch = {
-            "folder": cls._folder,
-            "folder_open": cls._folder_open,
-            "item": cls._item,
-            "item_warning": cls._item_warning,
-            "item_error": cls._item_error,
-            "item_disabled": cls._item_disabled,
-            "loading": cls._loading,
-            "add": cls._add,
-            "delete": cls._delete,
-            "edit": cls._edit,
-            "refresh": cls._refresh,
-            "expand": cls._expand,
-            "collapse": cls._collapse,
-            "info": cls._info,
-            "properties": cls._properties,
-        }
-        draw = dispatch.get(name, cls._unknown)
+        draw = getattr(cls, "_" + name) if name in cls.NAMES else cls._unknown
         draw(p, size)
         p.end()
         return QIcon(px)
@@ -208,10 +250,6 @@ class IconFactory:
     def _item_warning(p, s):
         p.setBrush(QColor("#f0ad4e"))
         p.setPen(QPen(QColor("#c87f0a"), 1))
-        pts = [s // 2, 1, s - 1, s - 2, 1, s - 2]
-        from PySide6.QtCore import QPoint
-        from PySide6.QtGui import QPolygon
-
         poly = [QPoint(s // 2, 1), QPoint(s - 1, s - 2), QPoint(1, s - 2)]
         p.drawPolygon(poly)
         p.setPen(QPen(QColor("#7a4800"), 1.5))
@@ -238,8 +276,6 @@ class IconFactory:
     def _loading(p, s):
         p.setBrush(Qt.NoBrush)
         for i in range(8):
-            import math
-
             angle = i * 45
             rad = math.radians(angle)
             alpha = 40 + int(215 * i / 7)
@@ -289,8 +325,6 @@ class IconFactory:
     def _refresh(p, s):
         p.setBrush(Qt.NoBrush)
         p.setPen(QPen(QColor("#0078d7"), 2))
-        import math
-
         p.drawArc(2, 2, s - 4, s - 4, 30 * 16, 300 * 16)
         # arrowhead
         p.setBrush(QColor("#0078d7"))
@@ -299,8 +333,6 @@ class IconFactory:
         cx, cy, r = s / 2, s / 2, s / 2 - 2
         ax = cx + r * math.cos(angle)
         ay = cy - r * math.sin(angle)
-        from PySide6.QtCore import QPoint
-
         p.drawPolygon(
             [
                 QPoint(int(ax), int(ay) - 3),
@@ -356,6 +388,23 @@ class IconFactory:
 # ═══════════════════════════════════════════════════════════
 
 
+class _LoadRunnable(QRunnable):
+    """
+    Runs the simulated DB fetch on a pool thread.
+    Builds a detached (roots, id_map, columns) result and hands it back to the
+    view-model through a queued signal, so the GUI thread only swaps it in.
+    """
+
+    def __init__(self, vm: TreeViewModel):
+        super().__init__()
+        self._vm = vm
+
+    def run(self):
+        time.sleep(0.65)  # mimic network/IO latency
+        raw = TreeViewModel._fetch_rows()
+        self._vm._loaded.emit(TreeViewModel._build_tree(raw))
+
+
 class TreeViewModel(QObject):
     """
     MVVM ViewModel for a two-level tree.
@@ -366,6 +415,7 @@ class TreeViewModel(QObject):
     load_finished()             DB fetch complete, roots rebuilt
     node_updated(node_id)       A node's data changed
     node_added(parent_id, row)  New child inserted
+    node_about_to_be_removed(parent_id, row)   Node is about to be deleted (parent_id -1 = root)
     node_removed(node_id)       Node deleted
     action_triggered(action, node)   UI should react (open dialog, etc.)
     status_message(str)
@@ -375,16 +425,25 @@ class TreeViewModel(QObject):
     load_finished = Signal()
     node_updated = Signal(int)  # node id
     node_added = Signal(int, int)  # parent_id, child_row
+    node_about_to_be_removed = Signal(int, int)  # parent_id (-1 for roots), row
     node_removed = Signal(int)  # node id
     action_triggered = Signal(str, object)  # action_name, TreeNode
     status_message = Signal(str)
+    _loaded = Signal(object)  # (roots, id_map, columns) from the pool thread
 
     def __init__(self):
         super().__init__()
         self._roots: list[TreeNode] = []
         self._id_map: dict[int, TreeNode] = {}
+        # Display text per node as parallel lists, indexed by node.store_index.
+        # Ordered like TreeItemModel's columns so data() is a single list lookup.
+        self.names: list[str] = []
+        self.statuses: list[str] = []
+        self.tags_joined: list[str] = []
+        self.tooltips: list[str] = []
         self._suppress = False
         self._next_id = 1000
+        self._loaded.connect(self._apply_loaded)
 
     # ── roots ─────────────────────────────────────────────
     @property
@@ -394,17 +453,23 @@ class TreeViewModel(QObject):
     def node_by_id(self, nid: int) -> TreeNode | None:
         return self._id_map.get(nid)
 
+    @property
+    def display_columns(self) -> tuple[list[str], list[str], list[str], list[str]]:
+        return self.names, self.statuses, self.tags_joined, self.tooltips
+
     # ── DB simulation ──────────────────────────────────────
     def load_from_db(self):
         """
         Simulate an async database fetch.
-        Uses QTimer to mimic network/IO delay without blocking UI.
+        The fetch and tree build run on QThreadPool; the result is
+        delivered back to the GUI thread via the queued _loaded signal.
         """
         self.load_started.emit()
         self.status_message.emit("Loading data from database…")
-        QTimer.singleShot(650, self._do_load)
+        QThreadPool.globalInstance().start(_LoadRunnable(self))
 
-    def _do_load(self):
+    @staticmethod
+    def _fetch_rows() -> list[dict]:
         """Simulated DB result — in production replace with real query."""
         raw_data = [
             {
@@ -528,16 +593,23 @@ class TreeViewModel(QObject):
                 ],
             },
         ]
-        self._build_tree(raw_data)
+        return raw_data
+
+    @Slot(object)
+    def _apply_loaded(self, result: tuple):
+        self._roots, self._id_map, (self.names, self.statuses, self.tags_joined, self.tooltips) = result
         self.load_finished.emit()
         self.status_message.emit(
             f"Loaded {len(self._roots)} categories, "
             f"{sum(n.child_count() for n in self._roots)} items."
         )
 
-    def _build_tree(self, raw: list[dict]):
-        self._roots.clear()
-        self._id_map.clear()
+    @staticmethod
+    def _build_tree(raw: list[dict]) -> tuple:
+        """Build a detached (roots, id_map, columns); safe to call off the GUI thread."""
+        roots: list[TreeNode] = []
+        id_map: dict[int, TreeNode] = {}
+        columns: tuple[list[str], list[str], list[str], list[str]] = ([], [], [], [])
         for rd in raw:
             parent = TreeNode(
                 id=rd["id"],
@@ -547,7 +619,9 @@ class TreeViewModel(QObject):
                 status=rd.get("status", "active"),
                 tags=rd.get("tags", []),
             )
-            self._id_map[parent.id] = parent
+            parent.row = len(roots)
+            id_map[parent.id] = parent
+            TreeViewModel._store_columns(columns, parent)
             for cd in rd.get("children", []):
                 child = TreeNode(
                     id=cd["id"],
@@ -558,9 +632,31 @@ class TreeViewModel(QObject):
                     tags=cd.get("tags", []),
                     parent=parent,
                 )
-                self._id_map[child.id] = child
+                child.row = len(parent.children)
+                id_map[child.id] = child
+                TreeViewModel._store_columns(columns, child)
                 parent.children.append(child)
-            self._roots.append(parent)
+            roots.append(parent)
+        return roots, id_map, columns
+
+    @staticmethod
+    def _store_columns(columns: tuple[list[str], ...], node: TreeNode):
+        """Write node's display text into columns, appending if it has no slot yet."""
+        tags = ", ".join(node.tags)
+        tooltip = (
+            f"<b>{node.name}</b><br>"
+            f"{node.description}<br>"
+            f"Status: <i>{node.status}</i><br>"
+            f"Tags: {tags or '—'}"
+        )
+        values = (node.name, node.status.capitalize(), tags, tooltip)
+        if node.store_index < 0:
+            node.store_index = len(columns[0])
+            for column, value in zip(columns, values):
+                column.append(value)
+        else:
+            for column, value in zip(columns, values):
+                column[node.store_index] = value
 
     # ── mutations ──────────────────────────────────────────
     def update_node(
@@ -572,6 +668,8 @@ class TreeViewModel(QObject):
             node.description = description
         if status is not None:
             node.status = status
+            node._cached_icon = None
+        self._store_columns(self.display_columns, node)
         self.node_updated.emit(node.id)
         self.status_message.emit(f"Updated '{node.name}'.")
 
@@ -585,18 +683,23 @@ class TreeViewModel(QObject):
             status="active",
             parent=parent,
         )
+        child.row = len(parent.children)
         parent.children.append(child)
         self._id_map[child.id] = child
-        self.node_added.emit(parent.id, len(parent.children) - 1)
+        self._store_columns(self.display_columns, child)
+        self.node_added.emit(parent.id, child.row)
         self.status_message.emit(f"Added '{name}' to '{parent.name}'.")
         return child
 
     def remove_node(self, node: TreeNode):
         name = node.name
-        if node.parent:
-            node.parent.children.remove(node)
-        else:
-            self._roots.remove(node)
+        self.node_about_to_be_removed.emit(node.parent.id if node.parent else -1, node.row)
+        siblings = node.parent.children if node.parent else self._roots
+        del siblings[node.row]
+        # Later siblings move up one row
+        for sibling in siblings[node.row :]:
+            sibling.row -= 1
+        # The node's column slot is left in place; the next load rebuilds the columns
         self._id_map.pop(node.id, None)
         self.node_removed.emit(node.id)
         self.status_message.emit(f"Removed '{name}'.")
@@ -615,6 +718,21 @@ class TreeViewModel(QObject):
 # 4. Qt ITEM MODEL  (adapter over TreeViewModel)
 # ═══════════════════════════════════════════════════════════
 
+# Item icon name and foreground colour per status; built once instead of per data() call
+_STATUS_ICON = {
+    "active": "item",
+    "warning": "item_warning",
+    "error": "item_error",
+    "disabled": "item_disabled",
+}
+_DEFAULT_FG = QColor("#000000")
+_STATUS_FG = {
+    "active": _DEFAULT_FG,
+    "warning": QColor("#8a6000"),
+    "error": QColor("#a31515"),
+    "disabled": QColor("#909090"),
+}
+
 
 class TreeItemModel(QAbstractItemModel):
     """
@@ -635,6 +753,7 @@ class TreeItemModel(QAbstractItemModel):
         vm.load_finished.connect(self._on_load_finished)
         vm.node_updated.connect(self._on_node_updated)
         vm.node_added.connect(self._on_node_added)
+        vm.node_about_to_be_removed.connect(self._on_node_about_to_be_removed)
         vm.node_removed.connect(self._on_node_removed)
 
     # ── QAbstractItemModel required ────────────────────────
@@ -657,11 +776,7 @@ class TreeItemModel(QAbstractItemModel):
         if node.parent is None:
             return QModelIndex()
         p = node.parent
-        if p.parent is None:
-            row = self._vm.roots.index(p)
-        else:
-            row = p.parent.children.index(p)
-        return self.createIndex(row, 0, p)
+        return self.createIndex(p.row, 0, p)
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.column() > 0:
@@ -681,12 +796,7 @@ class TreeItemModel(QAbstractItemModel):
         col = index.column()
 
         if role == Qt.DisplayRole:
-            if col == self.COL_NAME:
-                return node.name
-            if col == self.COL_STATUS:
-                return node.status.capitalize()
-            if col == self.COL_TAGS:
-                return ", ".join(node.tags)
+            return self._vm.display_columns[col][node.store_index]
 
         if role == Qt.DecorationRole and col == self.COL_NAME:
             return self._icon_for(node)
@@ -695,12 +805,7 @@ class TreeItemModel(QAbstractItemModel):
             return self._fg_color(node)
 
         if role == Qt.ToolTipRole:
-            return (
-                f"<b>{node.name}</b><br>"
-                f"{node.description}<br>"
-                f"Status: <i>{node.status}</i><br>"
-                f"Tags: {', '.join(node.tags) or '—'}"
-            )
+            return self._vm.tooltips[node.store_index]
 
         if role == Qt.UserRole:
             return node  # pass the raw node for context menus
@@ -729,25 +834,18 @@ class TreeItemModel(QAbstractItemModel):
     def _icon_for(self, node: TreeNode) -> QIcon:
         if node.is_loading:
             return IconFactory.get("loading")
-        if node.kind == NodeKind.CATEGORY:
-            return IconFactory.get("folder")
-        # child icon depends on status
-        mapping = {
-            "active": "item",
-            "warning": "item_warning",
-            "error": "item_error",
-            "disabled": "item_disabled",
-        }
-        return IconFactory.get(mapping.get(node.status, "item"))
+        icon = node._cached_icon
+        if icon is None:
+            if node.kind == NodeKind.CATEGORY:
+                icon = IconFactory.get("folder")
+            else:
+                # child icon depends on status
+                icon = IconFactory.get(_STATUS_ICON.get(node.status, "item"))
+            node._cached_icon = icon
+        return icon
 
     def _fg_color(self, node: TreeNode) -> QColor:
-        colors = {
-            "active": QColor("#000000"),
-            "warning": QColor("#8a6000"),
-            "error": QColor("#a31515"),
-            "disabled": QColor("#909090"),
-        }
-        return colors.get(node.status, QColor("#000000"))
+        return _STATUS_FG.get(node.status, _DEFAULT_FG)
 
     # ── ViewModel → Qt model signals ──────────────────────
     def _on_load_finished(self):
@@ -758,10 +856,9 @@ class TreeItemModel(QAbstractItemModel):
         node = self._vm.node_by_id(node_id)
         if node is None:
             return
-        row = node.row_in_parent()
-        parent_idx = self._parent_index(node)
-        tl = self.index(row, 0, parent_idx)
-        br = self.index(row, self.columnCount() - 1, parent_idx)
+        # The node carries its own row, so its indexes need no walk from the parent
+        tl = self._node_index(node)
+        br = self._node_index(node, self.columnCount() - 1)
         self.dataChanged.emit(tl, br)
 
     def _on_node_added(self, parent_id: int, child_row: int):
@@ -772,22 +869,17 @@ class TreeItemModel(QAbstractItemModel):
         self.beginInsertRows(parent_idx, child_row, child_row)
         self.endInsertRows()
 
-    def _on_node_removed(self, node_id: int):
-        # Node already removed from VM — just reset
-        self.beginResetModel()
-        self.endResetModel()
+    def _on_node_about_to_be_removed(self, parent_id: int, row: int):
+        # Only the removed row's indexes are invalidated; expansion state elsewhere survives
+        parent_node = self._vm.node_by_id(parent_id)
+        parent_idx = QModelIndex() if parent_node is None else self._node_index(parent_node)
+        self.beginRemoveRows(parent_idx, row, row)
 
-    def _parent_index(self, node: TreeNode) -> QModelIndex:
-        if node.parent is None:
-            return QModelIndex()
-        return self._node_index(node.parent)
+    def _on_node_removed(self, node_id: int):
+        self.endRemoveRows()
 
-    def _node_index(self, node: TreeNode) -> QModelIndex:
-        if node.parent is None:
-            row = self._vm.roots.index(node)
-        else:
-            row = node.parent.children.index(node)
-        return self.createIndex(row, 0, node)
+    def _node_index(self, node: TreeNode, col: int = 0) -> QModelIndex:
+        return self.createIndex(node.row, col, node)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -1300,13 +1392,9 @@ class MainWindow(QMainWindow):
         menu = QMenu(self)
 
         # Header label
-        icon_map = {
-            "active": "item",
-            "warning": "item_warning",
-            "error": "item_error",
-            "disabled": "item_disabled",
-        }
-        header = QAction(IconFactory.get(icon_map.get(node.status, "item")), f"  {node.name}", self)
+        header = QAction(
+            IconFactory.get(_STATUS_ICON.get(node.status, "item")), f"  {node.name}", self
+        )
         header.setEnabled(False)
         menu.addAction(header)
         menu.addSeparator()
@@ -1433,10 +1521,9 @@ class MainWindow(QMainWindow):
     # ─── helper: get QModelIndex for a node ───────────────
     def _index_for(self, node: TreeNode) -> QModelIndex:
         if node.parent is None:
-            row = self._vm.roots.index(node)
-            return self._model.index(row, 0, QModelIndex())
+            return self._model.index(node.row, 0, QModelIndex())
         p_idx = self._index_for(node.parent)
-        return self._model.index(node.row_in_parent(), 0, p_idx)
+        return self._model.index(node.row, 0, p_idx)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -1444,6 +1531,8 @@ class MainWindow(QMainWindow):
 # ═══════════════════════════════════════════════════════════
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # The window only ever asks for 16 px icons
+    IconFactory.warmup((16,))
     win = MainWindow()
     win.show()
     sys.exit(app.exec())
@@ -7,10 +7,6 @@ All views receive route params/data when navigated.
 import sys
 import unittest
 from abc import ABC, abstractmethod
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from PySide6.QtWidgets import QApplication
 from ui_master_material_views import EntryWindowView, MasterMaterialEditView, MasterMaterialView